@@ -276,7 +276,8 @@ class ChatAgent(Actor):
                 raise ResourceNotFoundException(
                     "Planning model not exit, Please configure on the Model Settings Page")
             chat_messages = self._chat_history_messages.get_messages()
-            logger.info("Start to calling LLM: %s. chat_messages: %s", self._request_id, chat_messages)
+            logger.info("Start to calling LLM: %s, %d messages", self._request_id, len(chat_messages))
+            logger.debug("[%s] chat_messages: %s", self._request_id, chat_messages)
             return self._llm_proxy.async_call_llm_stream(chat_messages, self._all_mcp_tools_meta)
         except Exception as e:
             logger.error("[%s] Error occurred while calling LLM: %s",
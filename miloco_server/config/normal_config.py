@@ -96,6 +96,7 @@ TRIGGER_RULE_RUNNER_CONFIG = {
     "vision_use_img_count": _config["trigger_rule_runner"]["vision_use_img_count"],
     "trigger_rule_log_ttl": _config["trigger_rule_runner"]["trigger_rule_log_ttl"],
     "request_timeout_seconds": _config["trigger_rule_runner"]["request_timeout_seconds"],
+    "max_vlm_inflight": _config["trigger_rule_runner"]["max_vlm_inflight"],
 }
 
 # Camera configuration
@@ -8,7 +8,7 @@ Handles CRUD operations for chat_history table, provides conversation history st
 
 import logging
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from miloco_server.utils.database import get_db_connector
 from miloco_server.schema.chat_history_schema import ChatHistoryStorage, ChatHistoryMessages, ChatHistorySession, ChatHistorySimpleInfo
@@ -346,9 +346,8 @@ class ChatHistoryDAO:
         Delete chat history records by IDs
         """
         try:
-            sql = "DELETE FROM chat_history WHERE session_id = ?"
-            params = [(session_id,) for session_id in session_ids]
-            affected_rows = self.db_connector.execute_many(sql, params)
+            sql = "DELETE FROM chat_history WHERE session_id IN ({placeholders})"
+            affected_rows = self.db_connector.execute_in_chunks(sql, list(session_ids))
             if affected_rows > 0:
                 logger.info(
                     "Chat history deleted successfully: session_ids=%s",
@@ -409,3 +408,57 @@ class ChatHistoryDAO:
                 days, e
             )
             return []
+
+    def get_sessions_before_days(
+            self, days: int,
+            limit: Optional[int] = None) -> List[Tuple[str, Optional[ChatHistorySession]]]:
+        """
+        Get session ids and sessions of history records before specified days in one query
+
+        Args:
+            days: Number of days, get records before days days
+            limit: Limit number of records to return, oldest first
+
+        Returns:
+            List[Tuple[str, Optional[ChatHistorySession]]]: (session_id, session) list,
+            session is None if not stored or not parseable
+        """
+        try:
+            cutoff_timestamp = int((datetime.now().timestamp() - days * 24 * 3600) * 1000)
+
+            sql = """
+                SELECT session_id, session
+                FROM chat_history
+                WHERE timestamp < ?
+                ORDER BY timestamp ASC
+            """
+            params = (cutoff_timestamp, )
+            if limit:
+                sql += " LIMIT ?"
+                params = (cutoff_timestamp, limit)
+
+            sessions = []
+            for row in self.db_connector.execute_query_iter(sql, params):
+                session = None
+                if row["session"]:
+                    try:
+                        session = self._deserialize_session(row["session"])
+                    except (ValueError, TypeError, KeyError, AttributeError) as e:
+                        logger.error(
+                            "Error parsing chat history session: session_id=%s, error=%s",
+                            row["session_id"], e
+                        )
+                sessions.append((row["session_id"], session))
+
+            logger.debug(
+                "Found %d chat history sessions older than %d days",
+                len(sessions), days
+            )
+            return sessions
+
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.error(
+                "Error getting chat history sessions before %d days: error=%s",
+                days, e
+            )
+            return []
@@ -210,6 +210,7 @@ class AuthConfigKeys:
 class SystemConfigKeys:
     DEVICE_UUID_KEY = "DEVICE_UUID_KEY"
     CURRENT_MODEL_ID_KEY = "CURRENT_MODEL_ID_KEY"
+    LAST_CLEANUP_TS_KEY = "LAST_CLEANUP_TS_KEY"
 
 class DeviceInfoKeys:
     CAMERA_INFO_KEY = "CAMERA_INFO_KEY"
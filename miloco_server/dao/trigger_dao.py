@@ -9,7 +9,7 @@ Handles CRUD operations for trigger_rule table
 import logging
 import json
 import uuid
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from miloco_server.utils.database import get_db_connector
 from miloco_server.schema.trigger_schema import TriggerRule, Action, TriggerFilter, ExecuteInfo
@@ -300,6 +300,35 @@ class TriggerRuleDAO:
             logger.error("Error checking trigger rule name existence: name=%s, error=%s", name, e)
             return False
 
+    def validate_upsert(self, name: str, rule_id: Optional[str] = None) -> Tuple[bool, bool]:
+        """
+        Check rule existence and name conflict in a single query
+
+        Args:
+            name: Rule name
+            rule_id: Rule ID (UUID) to check, also excluded from the name check
+
+        Returns:
+            Tuple[bool, bool]: (rule exists, name taken by another rule)
+        """
+        try:
+            sql = """
+                SELECT
+                    EXISTS(SELECT 1 FROM trigger_rule WHERE id = ?) AS id_exists,
+                    EXISTS(SELECT 1 FROM trigger_rule WHERE name = ? AND id IS NOT ?) AS name_taken
+            """
+            params = (rule_id, name, rule_id)
+
+            results = self.db_connector.execute_query(sql, params)
+
+            if results:
+                return bool(results[0]["id_exists"]), bool(results[0]["name_taken"])
+            return False, False
+
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.error("Error validating trigger rule upsert: id=%s, name=%s, error=%s", rule_id, name, e)
+            return False, False
+
     def count_all(self) -> int:
         """
         Get total count of trigger rules
@@ -7,10 +7,10 @@ Handles CRUD operations for trigger_rule_log table
 """
 
 import logging
-import json
 import uuid
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+from pydantic import TypeAdapter
 from miloco_server.utils.database import get_db_connector
 from miloco_server.schema.trigger_log_schema import (
     TriggerRuleLog,
@@ -20,6 +20,9 @@ from miloco_server.schema.trigger_log_schema import (
 
 logger = logging.getLogger(__name__)
 
+# Serialize nested results with pydantic's native JSON encoder in one pass
+_CONDITION_RESULTS_ADAPTER = TypeAdapter(List[TriggerConditionResult])
+
 
 class TriggerRuleLogDAO:
     """Trigger rule log data access object"""
@@ -31,16 +34,14 @@ class TriggerRuleLogDAO:
     def _dict_to_trigger_rule_log(self, data: Dict[str, Any]) -> TriggerRuleLog:
         """Convert database data to TriggerRuleLog object"""
         # Parse JSON fields
-        camera_condition_results_data = (json.loads(data["camera_condition_results"])
-                                        if data["camera_condition_results"] else [])
-        camera_condition_results = [TriggerConditionResult(**item)
-                                   for item in camera_condition_results_data]
+        camera_condition_results = (
+            _CONDITION_RESULTS_ADAPTER.validate_json(data["camera_condition_results"])
+            if data["camera_condition_results"] else [])
 
         # Parse execute_result
         execute_result = None
-        if data.get("execute_result"):
-            execute_result_data = json.loads(data["execute_result"])
-            execute_result = ExecuteResult(**execute_result_data)
+        if data["execute_result"]:
+            execute_result = ExecuteResult.model_validate_json(data["execute_result"])
 
             # Reduce the data sent to the UI, and obtain the dynamic execution results separately
             if execute_result.ai_recommend_dynamic_execute_result:
@@ -87,8 +88,8 @@ class TriggerRuleLogDAO:
                 log.trigger_rule_id,
                 log.trigger_rule_name,
                 log.trigger_rule_condition,
-                json.dumps([result.model_dump(mode="json") for result in log.condition_results]),
-                json.dumps(log.execute_result.model_dump(mode="json")) if log.execute_result else None
+                _CONDITION_RESULTS_ADAPTER.dump_json(log.condition_results).decode(),
+                log.execute_result.model_dump_json() if log.execute_result else None
             )
 
             with self.db_connector.get_connection() as conn:
@@ -178,11 +179,10 @@ class TriggerRuleLogDAO:
                 logger.warning("No log IDs provided for deletion")
                 return True
 
-            # Use executemany for better performance and cleaner code
-            sql = "DELETE FROM trigger_rule_log WHERE id = ?"
-            params_list = [(log_id,) for log_id in log_ids]
+            # Delete with chunked IN lists in one transaction
+            sql = "DELETE FROM trigger_rule_log WHERE id IN ({placeholders})"
 
-            affected_rows = self.db_connector.execute_many(sql, params_list)
+            affected_rows = self.db_connector.execute_in_chunks(sql, list(log_ids))
             if affected_rows > 0:
                 logger.info("Trigger rule logs deleted successfully: ids=%s, count=%s", log_ids, affected_rows)
                 return True
@@ -263,12 +263,13 @@ class TriggerRuleLogDAO:
             return 0
 
 
-    def get_logs_before_days(self, days: int) -> List[TriggerRuleLog]:
+    def get_logs_before_days(self, days: int, limit: Optional[int] = None) -> List[TriggerRuleLog]:
         """
         Get logs before specified days
 
         Args:
             days: Number of days, get records before days days
+            limit: Limit number of logs to return, oldest first
 
         Returns:
             List[TriggerRuleLog]: List of trigger rule log records before specified days
@@ -279,15 +280,17 @@ class TriggerRuleLogDAO:
             sql = """
                 SELECT * FROM trigger_rule_log
                 WHERE timestamp < ?
-                ORDER BY timestamp DESC
+                ORDER BY timestamp ASC
             """
             params = (cutoff_timestamp, )
+            if limit:
+                sql += " LIMIT ?"
+                params = (cutoff_timestamp, limit)
 
-            results = self.db_connector.execute_query(sql, params)
-
-            # Convert to TriggerRuleLog objects
+            # Convert to TriggerRuleLog objects while streaming rows
             trigger_rule_logs = [
-                self._dict_to_trigger_rule_log(row) for row in results
+                self._dict_to_trigger_rule_log(row)
+                for row in self.db_connector.execute_query_iter(sql, params)
             ]
 
             logger.debug(
@@ -324,7 +327,7 @@ class TriggerRuleLogDAO:
                 WHERE id = ?
             """
             params = (
-                json.dumps(execute_result.model_dump(mode="json")),
+                execute_result.model_dump_json(),
                 log_id
             )
 
@@ -372,8 +375,7 @@ class TriggerRuleLogDAO:
                 logger.debug("Execute result not found: id=%s", log_id)
                 return None, rule_id
 
-            execute_result_data = json.loads(row["execute_result"])
-            execute_result = ExecuteResult(**execute_result_data)
+            execute_result = ExecuteResult.model_validate_json(row["execute_result"])
 
             logger.debug("Execute result retrieved successfully: id=%s, rule_id=%s", log_id, rule_id)
             return execute_result, rule_id
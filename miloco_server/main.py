@@ -6,6 +6,7 @@ MILOCO Server main application entry point.
 Provides FastAPI application setup, middleware configuration, and server startup.
 """
 
+import asyncio
 import logging
 import threading
 import time
@@ -29,8 +30,10 @@ from miloco_server.controller import (
 )
 from miloco_server.middleware.auth_middleware import AuthStaticFiles
 from miloco_server.middleware.exception_handler import handle_exception
+from miloco_server.proxy.llm_proxy import close_shared_http_client
 from miloco_server.service.manager import get_manager
-from miloco_server.utils.database import init_database
+from miloco_server.utils.database import close_database, init_database
+from miloco_server.utils.http_request_forwarding import close_forwarding_client
 from miloco_server.utils.normal_util import get_uvicorn_log_config, update_localhost_cert
 
 logger = logging.getLogger(__name__)
@@ -52,6 +55,8 @@ async def catch_all_exceptions_middleware(request: Request, call_next):
 
 
 app.mount("/assets", StaticFiles(directory=str(STATIC_DIR / "assets")), name="assets")
+# Image manager is created lazily, the mounted directory must exist up front
+IMAGE_DIR.mkdir(parents=True, exist_ok=True)
 app.mount("/static/camera/images", AuthStaticFiles(directory=str(IMAGE_DIR)), name="images")
 app.include_router(web_router)
 app.include_router(auth_router, prefix="/api")
@@ -81,6 +86,11 @@ async def startup_event():
     """Application initialization operations on startup"""
     logger.info("Initializing application...")
 
+    # Tasks finishing without suspending (cached connections, small deletes) skip
+    # the event loop round trip, only available since Python 3.12
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     try:
         init_database()
         logger.info("Database initialization completed")
@@ -102,6 +112,9 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup operations when application shuts down"""
     logger.info("Application is shutting down...")
+    await close_shared_http_client()
+    await close_forwarding_client()
+    close_database()
     logger.info("Application has been shut down")
 
 
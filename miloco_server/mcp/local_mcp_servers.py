@@ -159,6 +159,8 @@ class LocalDefaultMcp(LocalMCPBase):
             location_info=location,
             user_choosed_camera_dids=camera_ids,
             camera_images=chat_data.camera_images,
+            miot_service=self._manager.miot_service,
+            language=self._manager.auth_service.get_user_language().language,
         ))
 
         future: asyncio.Future = actor_system.ask(vision_chat_tool,
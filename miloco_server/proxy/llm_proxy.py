@@ -7,11 +7,35 @@ import logging
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, Optional
 
-from openai import AsyncOpenAI, AsyncStream
+import httpx
+from openai import APITimeoutError, AsyncOpenAI, AsyncStream
 from openai.types.chat import ChatCompletionMessageParam, ChatCompletionToolParam
 
 logger = logging.getLogger(__name__)
 
+# Shared by all OpenAI proxies so refreshing proxies keeps warm keep-alive connections
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by all LLM proxies, create it on first use"""
+    global _shared_http_client  # pylint: disable=global-statement
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(600.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            follow_redirects=True,
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client():
+    """Close the HTTP client shared by all LLM proxies"""
+    global _shared_http_client  # pylint: disable=global-statement
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+
 
 class LLMProxy(ABC):
     """Abstract base class for large language model proxy."""
@@ -24,8 +48,9 @@ class LLMProxy(ABC):
 
     @abstractmethod
     async def async_call_llm(self, messages: list[ChatCompletionMessageParam],
-                           tools: Optional[list[ChatCompletionToolParam]] = None) -> dict[str, any]:
-        """Async call LLM (non-streaming)."""
+                           tools: Optional[list[ChatCompletionToolParam]] = None,
+                           timeout: Optional[float] = None) -> dict[str, any]:
+        """Async call LLM (non-streaming), raises TimeoutError if timeout seconds is exceeded."""
         pass
 
     @abstractmethod
@@ -85,7 +110,8 @@ class OpenAIProxy(LLMProxy):
 
         self.async_client = AsyncOpenAI(
             api_key=self.api_key,
-            base_url=self.base_url
+            base_url=self.base_url,
+            http_client=get_shared_http_client()
         )
         logger.info("LLM Proxy initialized with base_url: %s", self.base_url)
 
@@ -99,23 +125,32 @@ class OpenAIProxy(LLMProxy):
         return self.__str__()
 
     async def async_call_llm(self, messages: list[ChatCompletionMessageParam],
-                           tools: Optional[list[ChatCompletionToolParam]] = None) -> dict[str, any]:
+                           tools: Optional[list[ChatCompletionToolParam]] = None,
+                           timeout: Optional[float] = None) -> dict[str, any]:
         """
         Call vision language model (async version, non-streaming)
         
         Args:
             messages: Message list
             tools: Tool list
+            timeout: Request timeout seconds enforced by the HTTP client, no retry
+                on timeout so the whole call is bounded. None uses client defaults
             
         Returns:
             Raw OpenAI format model response
+
+        Raises:
+            TimeoutError: Request exceeds timeout seconds
         """
         try:
             logger.debug(
                 "Async calling model: %s, stream: False, messages: %s, tools: %s",
                 self.model_name, messages, tools
             )
-            completion = await self.async_client.chat.completions.create(
+            async_client = self.async_client
+            if timeout is not None:
+                async_client = async_client.with_options(timeout=timeout, max_retries=0)
+            completion = await async_client.chat.completions.create(
                 model=self.model_name,
                 messages=messages,
                 stream=False,
@@ -129,6 +164,8 @@ class OpenAIProxy(LLMProxy):
                 "content": completion.choices[0].message.content if completion.choices else ""
             }
 
+        except APITimeoutError as e:
+            raise TimeoutError(f"LLM request timeout after {timeout} seconds") from e
         except (ConnectionError, TimeoutError, ValueError, RuntimeError) as e:
             logger.error("Error calling async model: %s", str(e))
             return {
@@ -161,8 +198,12 @@ class OpenAIProxy(LLMProxy):
                 temperature=0,
             )
             logger.info("Async model stream call completed successfully, completion: %s", completion)
-            async for chunk in self._handle_async_stream_response(completion):
-                yield chunk
+            try:
+                async for chunk in self._handle_async_stream_response(completion):
+                    yield chunk
+            finally:
+                # Release the HTTP response when the consumer stops early
+                await completion.close()
 
         except (ConnectionError, TimeoutError, ValueError, RuntimeError) as e:
             logger.error("Error calling async model stream: %s", str(e))
@@ -36,10 +36,7 @@ class ChatHistoryMessages:
         """
         Add message
         """
-        add_content = []
-        for content_dict in content_list:
-            add_content.append(content_dict)
-        self._messages.append({"role": role, "content": add_content})
+        self._messages.append({"role": role, "content": list(content_list)})
 
     def add_tool_call_res_content(self, tool_call_id: str, name: str,
                                   content: str):
@@ -52,16 +52,19 @@ class MCPClientStatus(MCPClientBaseInfo):
     """MCP client status model"""
     connected: bool = Field(..., description="Connection status")
 
-def choose_mcp_list(mcp_ids: Optional[list[str]], all_mcp_list: list[MCPClientStatus]) -> list[MCPClientStatus]:
-    """Choose MCP list"""
+def choose_mcp_list(
+        mcp_ids: Optional[list[str]],
+        all_mcp_list: list[MCPClientStatus] | dict[str, MCPClientStatus]) -> list[MCPClientStatus]:
+    """Choose MCP list, pass a client_id keyed dict to reuse the index across many calls"""
     if not mcp_ids:
         return []
     choosed_mcp_list = []
-    all_mcp_dict = {client.client_id: client for client in all_mcp_list}
+    all_mcp_dict = (all_mcp_list if isinstance(all_mcp_list, dict)
+                    else {client.client_id: client for client in all_mcp_list})
     for mcp_id in mcp_ids:
         mcp_client = all_mcp_dict.get(mcp_id)
         if mcp_client:
-            choosed_mcp_list.append(MCPClientStatus.model_validate(mcp_client.model_dump()))
+            choosed_mcp_list.append(mcp_client.model_copy())
         else:
             choosed_mcp_list.append(MCPClientStatus(
                 client_id=mcp_id,
@@ -6,11 +6,12 @@ MIoT schema module
 Define MIoT device related data structures
 """
 
+from functools import cached_property
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from miloco_server.utils.media import image_manager
+from miloco_server.utils.media import get_image_manager
 from miloco_server.utils.normal_util import bytes_to_base64
 from miot.types import MIoTCameraInfo
 
@@ -54,14 +55,24 @@ class SceneInfo(BaseModel):
     scene_name: str = Field(..., description="Scene name", min_length=1)
 
 
-class CameraImgInfo(BaseModel):
-    data: bytes = Field(..., description="Image byte stream")
+class CameraImgInfoBase(BaseModel):
+    """Fields shared by all camera image variants"""
     timestamp: int = Field(..., description="Timestamp (millisecond Unix timestamp)")
 
-class CameraImgInfoBase64(CameraImgInfo):
+class CameraImgInfo(CameraImgInfoBase):
+    data: bytes = Field(..., description="Image byte stream")
+    dhash: Optional[int] = Field(
+        None, exclude=True, description="DHash of image, filled by the first motion check")
+
+    @cached_property
+    def base64_data(self) -> str:
+        """Base64 encoded image, frames stay in the camera queue across ticks so encode once"""
+        return bytes_to_base64(self.data)
+
+class CameraImgInfoBase64(CameraImgInfoBase):
     data: str = Field(..., description="Base64 encoded image")
 
-class CameraImgInfoPath(CameraImgInfo):
+class CameraImgInfoPath(CameraImgInfoBase):
     data: str = Field(..., description="Image path")
 
 class CameraImgSeq(BaseModel):
@@ -75,14 +86,14 @@ class CameraImgSeq(BaseModel):
             camera_info=self.camera_info,
             channel=self.channel,
             img_list=[CameraImgInfoBase64(
-                data=bytes_to_base64(img.data),
+                data=img.base64_data,
                 timestamp=img.timestamp
             ) for img in self.img_list]
         )
 
     async def store_to_path(self) -> "CameraImgPathSeq":
         """Store images to file paths"""
-        paths = await image_manager.save_image_list_async(
+        paths = await get_image_manager().save_image_list_async(
             self.camera_info.did,
             [img.data for img in self.img_list],
             self.channel
@@ -107,7 +118,7 @@ class CameraImgPathSeq(CameraImgSeq):
 
     async def delete_image_list_async(self) -> bool:
         image_name_list = [image.data for image in self.img_list]
-        return await image_manager.delete_image_list_async(image_name_list)
+        return await get_image_manager().delete_image_list_async(image_name_list)
 
 
 class HAConfig(BaseModel):
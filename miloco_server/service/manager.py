@@ -74,7 +74,7 @@ class Manager:
         self._mcp_config_dao = MCPConfigDAO()
         self._chat_history_dao = ChatHistoryDAO()
         self._trigger_rule_log_dao = TriggerRuleLogDAO()
-        self._cleaner = Cleaner(self._chat_history_dao, self._trigger_rule_log_dao)
+        self._cleaner = Cleaner(self._chat_history_dao, self._trigger_rule_log_dao, self._kv_dao)
         self._chat_companion = ChatCompanion(self._chat_history_dao)
 
         # Initialize device UUID
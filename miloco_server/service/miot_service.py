@@ -213,7 +213,8 @@ class MiotService:
             raise MiotServiceException(f"Failed to get MiOT device list: {str(e)}") from e
 
     async def get_miot_cameras_img(
-            self, camera_dids: list[str], vision_use_img_count: int) -> list[CameraImgSeq]:
+            self, camera_dids: list[str], vision_use_img_count: int,
+            online_only: bool = False) -> list[CameraImgSeq]:
         logger.info(
             "get_miot_cameras_img, camera_dids: %s", ", ".join(camera_dids))
         try:
@@ -221,8 +222,10 @@ class MiotService:
             if not all_camera_info:
                 return []
 
+            camera_did_set = set(camera_dids)
             selected_camera_info: list[MIoTCameraInfo] = [
-                info for info in all_camera_info.values() if (info.did in camera_dids)
+                info for info in all_camera_info.values()
+                if info.did in camera_did_set and (info.online or not online_only)
             ]
 
             camera_channels: list[CameraChannel] = []
@@ -241,6 +244,8 @@ class MiotService:
                         camera_channel.did, camera_channel.channel
                     )
                     continue
+                if online_only and not camera_img_seq.img_list:
+                    continue
 
                 camera_img_seqs.append(camera_img_seq)
             return camera_img_seqs
@@ -83,9 +83,7 @@ class TriggerRuleDynamicExecutor(Actor):
             logger.error(
                 "[%s] Error in receiveMessage method: %s", self.request_id, e, exc_info=True)
             self._close_web_sockets()
-            if self._future:
-                self._future.set_result(False)
-                self._future = None
+            self._resolve_future(False)
 
     def _handle_start(self):
         """
@@ -198,11 +196,15 @@ class TriggerRuleDynamicExecutor(Actor):
         """Handle Actor exit request"""
         self._close_web_sockets()
         self._store_chat_history_session()
-        if self._future:
-            self._future.set_result(True)
-            self._future = None
+        self._resolve_future(True)
         logger.info("[%s] Exit request handled successfully", self.request_id)
 
+    def _resolve_future(self, result: bool):
+        """Resolve start future, the waiter may have cancelled it on timeout"""
+        if self._future and not self._future.done():
+            self._future.set_result(result)
+        self._future = None
+
     def _store_chat_history_session(self):
         """Store chat history session"""
         execute_result, _ = self._trigger_rule_log_dao.get_execute_result(self.request_id)
@@ -7,6 +7,7 @@ Handles trigger-related business logic and data validation
 """
 
 import time
+from collections import Counter
 from typing import Callable, List, Dict, Optional
 import asyncio
 import logging
@@ -30,18 +31,23 @@ from miloco_server.schema.trigger_log_schema import (
 from miloco_server.schema.trigger_schema import (
     Action, TriggerRule, ExecuteType, SendingState
 )
-from miloco_server.utils.check_img_motion import check_camera_motion
 from miloco_server.utils.local_models import ModelPurpose
+from miot.types import MIoTCameraInfo
 from miloco_server.utils.prompt_helper import TriggerRuleConditionPromptBuilder
 from miloco_server.utils.trigger_filter import trigger_filter
 from miloco_server.service import trigger_rule_dynamic_executor_cache
-from miloco_server.service.trigger_rule_dynamic_executor import START, TriggerRuleDynamicExecutor
 
 logger = logging.getLogger(name=__name__)
 
 
 class TriggerRuleRunner:
     """Trigger service class"""
+    # LLM numeric output -> (is_happened, is_same_action)
+    _OUTPUT_MAP: Dict[str, tuple[bool, bool]] = {
+        "0": (False, False),
+        "1": (True, False),
+        "2": (True, True),
+    }
 
     def __init__(self, trigger_rules: List[TriggerRule], miot_proxy: MiotProxy,
                  get_llm_proxy_by_purpose: Callable[[ModelPurpose], LLMProxy],
@@ -53,18 +59,36 @@ class TriggerRuleRunner:
             rule.id: rule
             for rule in trigger_rules if rule.id is not None
         }
+        # Camera set per rule, built on ingestion for O(1) membership tests each tick
+        self._rule_cameras: Dict[str, frozenset[str]] = {
+            rule_id: frozenset(rule.cameras)
+            for rule_id, rule in self.trigger_rules.items()
+        }
+        # Number of enabled rules using each camera, maintained on rule add/remove
+        self._camera_refcount: Counter[str] = Counter()
+        self._enabled_rule_count = 0
+        for rule in self.trigger_rules.values():
+            self._count_rule_cameras(rule, 1)
         self._get_llm_proxy_by_purpose = get_llm_proxy_by_purpose
         self.miot_proxy = miot_proxy
         self._get_language = get_language
         self.trigger_rule_log_dao = trigger_rule_log_dao
         self._tool_executor = tool_executor
         self._task = None
+        self._current_tick: Optional[asyncio.Task] = None
+        # Background action execution tasks, referenced until done
+        self._action_tasks: set[asyncio.Task] = set()
         self._is_running: bool = False
         self._interval_seconds = TRIGGER_RULE_RUNNER_CONFIG["interval_seconds"]
         self._vision_use_img_count = TRIGGER_RULE_RUNNER_CONFIG["vision_use_img_count"]
-        # Per-camera last happened cache: key=(rule_id, camera_did, channel), value=CameraImgSeq
-        self._last_happened_cache: Dict[tuple, CameraImgSeq] = {}
+        # Per-camera last happened cache: rule_id -> {(camera_did, channel): CameraImgSeq}
+        self._last_happened_cache: Dict[str, Dict[tuple[str, int], CameraImgSeq]] = {}
         self._sending_states: Dict[str, SendingState] = {}
+        # Converted camera info cache: did -> (source MIoT camera info, CameraInfo)
+        self._camera_info_cache: Dict[str, tuple[MIoTCameraInfo, CameraInfo]] = {}
+        # Bound concurrent vision LLM HTTP requests across all rules and ticks,
+        # prompts are built outside so only the request itself holds a permit
+        self._vlm_semaphore = asyncio.Semaphore(TRIGGER_RULE_RUNNER_CONFIG["max_vlm_inflight"])
         logger.info(
             "TriggerRuleRunner init success, trigger_rules: %s", self.trigger_rules
         )
@@ -73,26 +97,43 @@ class TriggerRuleRunner:
         return self._get_llm_proxy_by_purpose(
             ModelPurpose.VISION_UNDERSTANDING)
 
+    def _count_rule_cameras(self, rule: TriggerRule, delta: int):
+        """Add (delta=1) or remove (delta=-1) cameras of an enabled rule from the refcount"""
+        if not rule.enabled:
+            return
+        self._enabled_rule_count += delta
+        for camera_id in self._rule_cameras[rule.id]:
+            self._camera_refcount[camera_id] += delta
+            if self._camera_refcount[camera_id] <= 0:
+                del self._camera_refcount[camera_id]
+
     def add_trigger_rule(self, trigger_rule: TriggerRule):
         """Add trigger rule"""
+        if trigger_rule.id in self.trigger_rules:
+            self._count_rule_cameras(self.trigger_rules[trigger_rule.id], -1)
         self.trigger_rules[trigger_rule.id] = trigger_rule
+        self._rule_cameras[trigger_rule.id] = frozenset(trigger_rule.cameras)
+        self._count_rule_cameras(trigger_rule, 1)
 
     def remove_trigger_rule(self, rule_id: str):
         """Remove trigger rule"""
         if rule_id in self.trigger_rules:
+            self._count_rule_cameras(self.trigger_rules[rule_id], -1)
             del self.trigger_rules[rule_id]
+            self._rule_cameras.pop(rule_id, None)
             self._sending_states.pop(rule_id, None)
         # Clean up cache entries for this rule
-        keys_to_remove = [k for k in self._last_happened_cache if k[0] == rule_id]
-        for key in keys_to_remove:
-            del self._last_happened_cache[key]
+        self._last_happened_cache.pop(rule_id, None)
 
     async def _periodic_task(self):
         """Scheduled task execution method, runs at configured interval"""
         while self._is_running:
             try:
-                # Execute scheduled task logic
-                asyncio.create_task(self._execute_scheduled_task())
+                # Execute scheduled task logic, skip if the previous tick is still running
+                if self._current_tick and not self._current_tick.done():
+                    logger.warning("Previous scheduled task is still running, skip this tick")
+                else:
+                    self._current_tick = asyncio.create_task(self._execute_scheduled_task())
                 # Wait for configured interval
                 await asyncio.sleep(self._interval_seconds)
             except Exception as e:  # pylint: disable=broad-except
@@ -101,15 +142,18 @@ class TriggerRuleRunner:
                 await asyncio.sleep(self._interval_seconds)
 
     async def _check_scheduled_task(self, llm_proxy, enabled_rules):
-        # only load used camera in rules
-        needed_camera_ids = set()
-        for _, rule in enabled_rules:
-            needed_camera_ids.update(rule.cameras)
+        # only load used camera in rules, the refcount is exact when no enabled rule was filtered
+        if len(enabled_rules) == self._enabled_rule_count:
+            needed_camera_ids = self._camera_refcount.keys()
+        else:
+            needed_camera_ids = set()
+            for rule_id, _ in enabled_rules:
+                needed_camera_ids.update(self._rule_cameras[rule_id])
 
         # Load used camera info
         miot_camera_info_dict = await self.miot_proxy.get_cameras()
         camera_info_dict = {
-            camera_id: CameraInfo.model_validate(miot_camera_info.model_dump())
+            camera_id: self._get_camera_info(camera_id, miot_camera_info)
             for camera_id, miot_camera_info in miot_camera_info_dict.items()
             if camera_id in needed_camera_ids
         }
@@ -119,27 +163,50 @@ class TriggerRuleRunner:
                                       tuple[bool,
                                             Optional[CameraImgSeq]]]] = {}
 
-        # Calculate motion changes
-        for camera_id, camera_info in camera_info_dict.items():
-            if camera_id not in camera_motion_dict:
-                camera_motion_dict[camera_id] = {}
-            for channel in range(camera_info.channel_count or 1):
-                logger.info(
-                    "camera %s channel %s get recent camera img", camera_id, channel
-                )
-                camera_img_seq = self.miot_proxy.get_recent_camera_img(
-                    camera_id, channel, self._vision_use_img_count)
-                if camera_img_seq and self._check_camera_motion(
-                        camera_img_seq):
-                    logger.info(
-                        "camera %s channel %s motion: true", camera_id, channel)
-                    camera_motion_dict[camera_id][channel] = (True,
-                                                              camera_img_seq)
-                else:
-                    logger.info(
-                        "camera %s channel %s motion: false", camera_id, channel)
-                    camera_motion_dict[camera_id][channel] = (False,
-                                                              camera_img_seq)
+        # Get recent images of every camera channel, they are read from memory
+        camera_channels = [
+            (camera_id, channel)
+            for camera_id, camera_info in camera_info_dict.items()
+            for channel in range(camera_info.channel_count or 1)
+        ]
+        camera_img_seqs: list[Optional[CameraImgSeq]] = []
+        for camera_id, channel in camera_channels:
+            logger.info(
+                "camera %s channel %s get recent camera img", camera_id, channel
+            )
+            camera_img_seqs.append(self.miot_proxy.get_recent_camera_img(
+                camera_id, channel, self._vision_use_img_count))
+
+        # Calculate motion changes concurrently off the event loop
+        motions = await asyncio.gather(*[
+            self._check_camera_motion_async(camera_img_seq)
+            for camera_img_seq in camera_img_seqs
+        ], return_exceptions=True)
+
+        for (camera_id, channel), camera_img_seq, motion in zip(
+                camera_channels, camera_img_seqs, motions):
+            if isinstance(motion, Exception):
+                logger.error(
+                    "camera %s channel %s motion check failed: %s", camera_id, channel, motion)
+                motion = False
+            logger.info(
+                "camera %s channel %s motion: %s", camera_id, channel, str(motion).lower())
+            camera_motion_dict.setdefault(camera_id, {})[channel] = (motion,
+                                                                    camera_img_seq)
+
+        # Flatten motion results once per tick, rules sharing cameras then
+        # filter this list instead of re-walking the nested dict
+        camera_motion_list: list[tuple[str, int, bool,
+                                       Optional[CameraImgSeq], CameraInfo]] = [
+            (camera_id, channel, is_motion, camera_img_seq,
+             camera_info_dict[camera_id])
+            for camera_id, channel_motion_dict in camera_motion_dict.items()
+            for channel, (is_motion,
+                          camera_img_seq) in channel_motion_dict.items()
+        ]
+
+        # Identical prompts of different rules in this tick share one LLM request
+        vision_request_tasks: dict[tuple, tuple[asyncio.Task, Optional[CameraImgSeq]]] = {}
 
         # Create concurrent task list
         tasks = []
@@ -148,8 +215,8 @@ class TriggerRuleRunner:
             logger.info(
                 "Preparing to check trigger rule: %s %s", rule_id, rule.name)
             task = self._check_trigger_condition(rule, llm_proxy,
-                                                 camera_motion_dict,
-                                                 camera_info_dict)
+                                                 camera_motion_list,
+                                                 vision_request_tasks)
             tasks.append(task)
             rule_info_list.append((rule_id, rule))
 
@@ -159,6 +226,18 @@ class TriggerRuleRunner:
 
         return rule_info_list, condition_results, camera_motion_dict
 
+    def _get_camera_info(self, camera_id: str, miot_camera_info: MIoTCameraInfo) -> CameraInfo:
+        """
+        Convert MIoT camera info, reuse the last result while the source is unchanged.
+        Refreshing cameras replaces the info objects, so identity marks a change.
+        """
+        cached = self._camera_info_cache.get(camera_id)
+        if cached and cached[0] is miot_camera_info:
+            return cached[1]
+        camera_info = CameraInfo.model_validate(miot_camera_info.model_dump())
+        self._camera_info_cache[camera_id] = (miot_camera_info, camera_info)
+        return camera_info
+
     async def _execute_scheduled_task(self):
         start_time = int(time.time() * 1000)
 
@@ -199,12 +278,19 @@ class TriggerRuleRunner:
                 )
                 continue
                 
-            execable = any([
+            # Skipping false results is safe: post_filter(rule_id, False) only sets
+            # up the default history deque (pre_filter or the first true result
+            # does that too) and never returns True or records a trigger.
+            # Stopping at the first accepted result is safe as well: it records
+            # the trigger time, so any later call returns False on the minimum
+            # interval check without touching state
+            execable = any(
                 trigger_filter.post_filter(
                     rule_id,
                     condition_result.result)
                 for condition_result in condition_result_list
-            ])
+                if condition_result.result
+            )
 
             is_dynamic_action_running = self._check_dynamic_action_is_running(rule_id)
             logger.info(
@@ -212,18 +298,36 @@ class TriggerRuleRunner:
                 rule_id, execable, is_dynamic_action_running)
 
             if execable and not is_dynamic_action_running:
-                execute_id = str(uuid.uuid4())
-                execute_result = await self._execute_trigger_action(
-                    execute_id, rule, camera_motion_dict)
-                await self._log_rule_execution(execute_id, start_time, rule,
-                                               camera_motion_dict,
-                                               condition_result_list,
-                                               execute_result)
+                # Run in background so a slow action does not hold up other rules
+                task = asyncio.create_task(self._execute_and_log_rule(
+                    start_time, rule, camera_motion_dict, condition_result_list))
+                self._action_tasks.add(task)
+                task.add_done_callback(self._action_tasks.discard)
 
         logger.info(
             "Scheduled task completed, checked %d trigger rules", len(enabled_rules)
         )
 
+    async def _execute_and_log_rule(
+            self,
+            start_time: int,
+            rule: TriggerRule,
+            camera_motion_dict: dict[str, dict[int,
+                                           tuple[bool,
+                                                 Optional[CameraImgSeq]]]],
+            condition_result_list: list[TriggerConditionResult]):
+        """Execute trigger action of rule and record the execution log"""
+        execute_id = str(uuid.uuid4())
+        try:
+            execute_result = await self._execute_trigger_action(
+                execute_id, rule, camera_motion_dict)
+            await self._log_rule_execution(execute_id, start_time, rule,
+                                           camera_motion_dict,
+                                           condition_result_list,
+                                           execute_result)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("[%s] Execute rule %s failed: %s", execute_id, rule.name, e)
+
     async def _log_rule_execution(
             self,
             execute_id: str,
@@ -239,11 +343,17 @@ class TriggerRuleRunner:
             "Rule %s triggered, condition results: %s", rule.name, condition_result_list
         )
 
+        pending_store: list[tuple[TriggerConditionResult, CameraImgSeq]] = []
         for condition_result in condition_result_list:
             is_motion, camera_img_seq = camera_motion_dict[condition_result.camera_info.did][condition_result.channel]
             if is_motion and condition_result.result and camera_img_seq:
-                path_seq: CameraImgPathSeq = await camera_img_seq.store_to_path()
-                condition_result.images = path_seq.img_list
+                pending_store.append((condition_result, camera_img_seq))
+
+        # Store images of all triggered cameras concurrently
+        path_seqs: list[CameraImgPathSeq] = await asyncio.gather(
+            *[camera_img_seq.store_to_path() for _, camera_img_seq in pending_store])
+        for (condition_result, _), path_seq in zip(pending_store, path_seqs):
+            condition_result.images = path_seq.img_list
 
         trigger_rule_log = TriggerRuleLog(
             id=execute_id,
@@ -255,8 +365,10 @@ class TriggerRuleRunner:
             execute_result=execute_result,
         )
 
-        # Save to database
-        log_id = self.trigger_rule_log_dao.create(trigger_rule_log)
+        # Save to database in a worker thread, the insert and its WAL sync block,
+        # so keep the loop free for LLM, HTTP and camera callbacks meanwhile.
+        # Only other DAO calls wait on the shared connection lock
+        log_id = await asyncio.to_thread(self.trigger_rule_log_dao.create, trigger_rule_log)
         if log_id:
             logger.info(
                 "Trigger rule log saved to database: id=%s, rule_id=%s", log_id, rule.id
@@ -290,6 +402,10 @@ class TriggerRuleRunner:
             except asyncio.CancelledError:
                 pass
 
+        # Let triggered actions finish and be logged
+        if self._action_tasks:
+            await asyncio.gather(*self._action_tasks, return_exceptions=True)
+
         logger.info("Scheduled task stopped")
 
     def is_task_running(self) -> bool:
@@ -298,80 +414,125 @@ class TriggerRuleRunner:
 
     async def _call_vision_understaning(self, llm_proxy: LLMProxy, messages):
         """
-        Call vision understanding LLM
+        Call vision understanding LLM, at most max_vlm_inflight requests run at once
 
         Returns:
             LLM response result
         """
-        return await asyncio.wait_for(llm_proxy.async_call_llm(messages), timeout=TRIGGER_RULE_RUNNER_CONFIG["request_timeout_seconds"])
+        async with self._vlm_semaphore:
+            return await llm_proxy.async_call_llm(
+                messages, timeout=TRIGGER_RULE_RUNNER_CONFIG["request_timeout_seconds"])
 
-    @staticmethod
-    def _parse_llm_output(content) -> Optional[tuple[bool, bool]]:
+    @classmethod
+    def _parse_llm_output(cls, content) -> Optional[tuple[bool, bool]]:
         """Parse LLM numeric output (0/1/2) into (is_happened, is_same_action).
-        Returns None if output is invalid."""
+        Returns None if output is invalid, the caller logs it."""
         try:
+            stripped = content.strip()
+        except AttributeError:
             stripped = str(content).strip()
-        except Exception:  # pylint: disable=broad-except
-            logger.error("Invalid LLM output: %s", content)
-            return None
-        
-        if stripped == "0":
-            return (False, False)
-        if stripped == "1":
-            return (True, False)
-        if stripped == "2":
-            return (True, True)
-        else:
-            logger.error("Invalid LLM output: %s", content)
-            return None
+        return cls._OUTPUT_MAP.get(stripped)
+
+    def _get_last_happened(self, rule_id: str, camera_id: str, channel: int) -> Optional[CameraImgSeq]:
+        """Get last happened frames of rule on camera channel"""
+        return self._last_happened_cache.get(rule_id, {}).get((camera_id, channel))
+
+    def _set_last_happened(self, rule_id: str, camera_id: str, channel: int,
+                           camera_img_seq: CameraImgSeq):
+        """Set last happened frames of rule on camera channel"""
+        self._last_happened_cache.setdefault(rule_id, {})[camera_id, channel] = camera_img_seq
+
+    def _acquire_sending_state(self, rule_id: str, now: float) -> bool:
+        """
+        Mark rule as sending unless a previous check is still in flight.
+        A flag older than the request timeout is treated as expired, so a lost
+        release never blocks the rule forever.
+        """
+        sending_state = self._sending_states.get(rule_id)
+        if (sending_state and sending_state.flag and
+                now - sending_state.time < TRIGGER_RULE_RUNNER_CONFIG["request_timeout_seconds"]):
+            return False
+        self._sending_states[rule_id] = SendingState(flag=True, time=now)
+        return True
+
+    def _release_sending_state(self, rule_id: str):
+        """Clear sending flag of rule"""
+        self._sending_states[rule_id] = SendingState(flag=False, time=time.time())
 
     async def _check_trigger_condition(
         self, rule: TriggerRule, llm_proxy: LLMProxy,
-        camera_motion_dict: dict[str, dict[int,
-                                           tuple[bool,
-                                                 Optional[CameraImgSeq]]]],
-        camera_info_dict: dict[str,
-                               CameraInfo]) -> List[TriggerConditionResult]:
-
-        cameras_video: dict[tuple[str, int], CameraImgSeq] = {}
+        camera_motion_list: list[tuple[str, int, bool,
+                                       Optional[CameraImgSeq], CameraInfo]],
+        vision_request_tasks: dict[tuple, tuple[asyncio.Task,
+                                                Optional[CameraImgSeq]]]
+    ) -> List[TriggerConditionResult]:
+
+        cameras_video: list[tuple[str, int, CameraImgSeq, CameraInfo,
+                                  Optional[CameraImgSeq]]] = []
         condition_result_list: List[TriggerConditionResult] = []
         start_time = time.time()
 
-        sending_state = self._sending_states.get(rule.id)
-        if sending_state and sending_state.flag and start_time - sending_state.time < TRIGGER_RULE_RUNNER_CONFIG["request_timeout_seconds"]:
+        if not self._acquire_sending_state(rule.id, start_time):
             logger.info("%s %s Rule %s is sending, skip", start_time, rule.name, rule.id)
             return []
         logger.info("%s %s Rule %s start check", start_time, rule.name, rule.id)
-        self._sending_states[rule.id] = SendingState(flag=True, time=start_time)
 
         try:
-            for camera_id in rule.cameras:
-                camera_info = camera_info_dict[camera_id]
-                channel_motion_dict = camera_motion_dict[camera_id]
-                for channel, (if_motion,
-                            camera_img_seq) in channel_motion_dict.items():
-                    # check sending state flag:
-                    if not if_motion or not camera_img_seq:
-                        continue
-                    cameras_video[camera_id, channel] = camera_img_seq
-
-            # Concurrently execute LLM calls for all cameras  
+            rule_cameras = self._rule_cameras[rule.id]
+            for (camera_id, channel, if_motion, camera_img_seq,
+                 camera_info) in camera_motion_list:
+                if camera_id not in rule_cameras:
+                    continue
+                if not if_motion or not camera_img_seq:
+                    continue
+                # Load last happened frames once, both passes below reuse them
+                cameras_video.append(
+                    (camera_id, channel, camera_img_seq, camera_info,
+                     self._get_last_happened(rule.id, camera_id, channel)))
+
+            # Frames unchanged since the last happened frames are the same action
+            # (output 2), update the cache and skip the LLM call for them
+            same_as_last_list = await asyncio.gather(*[
+                self._check_same_as_last_happened(camera_img_seq, last_happened_img_seq)
+                for _, _, camera_img_seq, _, last_happened_img_seq in cameras_video
+            ], return_exceptions=True)
+            cameras_video_to_check = []
+            for video, same_as_last in zip(cameras_video, same_as_last_list):
+                camera_id, channel, camera_img_seq, _, _ = video
+                if same_as_last is True:
+                    logger.info(
+                        "Rule %s camera %s channel %s: frames unchanged since last happened, "
+                        "treat as output 2 and skip LLM call", rule.name, camera_id, channel)
+                    self._set_last_happened(rule.id, camera_id, channel, camera_img_seq)
+                    continue
+                cameras_video_to_check.append(video)
+            cameras_video = cameras_video_to_check
+
+            # Concurrently execute LLM calls for all cameras
+            language = self._get_language()
             tasks = []
-            for (camera_id, channel), camera_img_seq in cameras_video.items():
-                # Load last happened frames for this camera/channel
-                last_happened_img_seq = self._last_happened_cache.get((rule.id, camera_id, channel))
-                messages = TriggerRuleConditionPromptBuilder.build_trigger_rule_prompt(
-                    camera_img_seq, rule.condition, self._get_language(),
-                    last_happened_img_seq=last_happened_img_seq)
-                task = self._call_vision_understaning(llm_proxy, messages.get_messages())
-                tasks.append(task)
-
-            # Concurrently execute all tasks
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
+            for camera_id, channel, camera_img_seq, _, last_happened_img_seq in cameras_video:
+                # Frames are shared by all rules in this tick, so the prompt is identical
+                # when condition and last happened frames match. The map keeps the
+                # last happened sequence alive, so its id stays unique within the tick.
+                request_key = (camera_id, channel, rule.condition, language,
+                               id(last_happened_img_seq))
+                request = vision_request_tasks.get(request_key)
+                if request is None:
+                    messages = TriggerRuleConditionPromptBuilder.build_trigger_rule_prompt(
+                        camera_img_seq, rule.condition, language,
+                        last_happened_img_seq=last_happened_img_seq)
+                    request = (asyncio.create_task(self._call_vision_understaning(
+                        llm_proxy, messages.get_messages())), last_happened_img_seq)
+                    vision_request_tasks[request_key] = request
+                tasks.append(request[0])
+
+            # Shield shared requests so one rule being cancelled does not cancel others
+            responses = await asyncio.gather(*[asyncio.shield(task) for task in tasks],
+                                             return_exceptions=True)
             
-            for ((camera_id, channel),
-                camera_img_seq), response in zip(cameras_video.items(),
-                                                responses):
+            for (camera_id, channel, camera_img_seq,
+                 camera_info, _), response in zip(cameras_video, responses):
                 logger.info("Rule %s %s Camera %s channel %s LLM response: %s", rule.id, rule.name, camera_id, channel, response)
 
                 if isinstance(response, TimeoutError):
@@ -426,8 +587,8 @@ class TriggerRuleRunner:
                     logger.info(
                         "Rule %s camera %s channel %s: action triggered, and is a new action(execution needed) (output 1), updating cache and returning True",
                         rule.name, camera_id, channel)
-                    self._last_happened_cache[(rule.id, camera_id, channel)] = camera_img_seq
-                    condition_result_list.append(TriggerConditionResult(camera_info=camera_info_dict[camera_id],
+                    self._set_last_happened(rule.id, camera_id, channel, camera_img_seq)
+                    condition_result_list.append(TriggerConditionResult(camera_info=camera_info,
                                                 channel=channel,
                                                 result=True))
                     continue
@@ -437,21 +598,32 @@ class TriggerRuleRunner:
                     logger.info(
                         "Rule %s camera %s channel %s: action triggered, but is not a new action (No execution needed) (output 2), only update cache",
                         rule.name, camera_id, channel)
-                    self._last_happened_cache[(rule.id, camera_id, channel)] = camera_img_seq
+                    self._set_last_happened(rule.id, camera_id, channel, camera_img_seq)
                     continue
 
         finally:
-            end_time = time.time()
-            self._sending_states[rule.id] = SendingState(flag=False, time=end_time)
+            self._release_sending_state(rule.id)
             
         return condition_result_list
 
-    def _check_camera_motion(self, camera_img_seq: CameraImgSeq) -> bool:
-        """Detect motion in images"""
-        if len(camera_img_seq.img_list) < 2:
+    async def _check_same_as_last_happened(
+            self, camera_img_seq: CameraImgSeq,
+            last_happened_img_seq: Optional[CameraImgSeq]) -> bool:
+        """Check in a worker thread if frames are the same as last happened frames"""
+        if not last_happened_img_seq or not last_happened_img_seq.img_list:
             return False
-        return check_camera_motion(camera_img_seq.img_list[0].data,
-                                   camera_img_seq.img_list[-1].data)
+        from miloco_server.utils.check_img_motion import check_camera_img_seq_same_async  # pylint: disable=import-outside-toplevel
+        return await check_camera_img_seq_same_async(
+            camera_img_seq.img_list, last_happened_img_seq.img_list)
+
+    async def _check_camera_motion_async(self, camera_img_seq: Optional[CameraImgSeq]) -> bool:
+        """Detect motion in images, both frames are decoded concurrently in worker threads"""
+        if not camera_img_seq or len(camera_img_seq.img_list) < 2:
+            return False
+        # Image hashing stack is only needed once cameras produce frames
+        from miloco_server.utils.check_img_motion import check_camera_motion_async  # pylint: disable=import-outside-toplevel
+        return await check_camera_motion_async(camera_img_seq.img_list[0],
+                                               camera_img_seq.img_list[-1])
 
     async def _execute_trigger_action(
         self, execute_id: str, rule: TriggerRule,
@@ -519,6 +691,9 @@ class TriggerRuleRunner:
                                            tuple[bool,
                                                  Optional[CameraImgSeq]]]]) -> None:
         """Execute dynamic action"""
+        # Dynamic executor is rarely configured, import it on first use
+        from miloco_server.service.trigger_rule_dynamic_executor import (  # pylint: disable=import-outside-toplevel
+            START, TriggerRuleDynamicExecutor)
         try:
             logger.info("[%s] Executing dynamic action: %s", execute_id, rule.name)
             trigger_rule_dynamic_executor = trigger_rule_dynamic_executor_cache.get(rule.id)
@@ -532,7 +707,12 @@ class TriggerRuleRunner:
                 lambda: TriggerRuleDynamicExecutor(
                     execute_id, rule, self.trigger_rule_log_dao, camera_motion_dict))
             trigger_rule_dynamic_executor_cache[rule.id] = trigger_rule_dynamic_executor
+            # Executor replies with an asyncio future resolved on completion,
+            # awaiting it is callback driven and cancelled on timeout
             future = actor_system.ask(trigger_rule_dynamic_executor, START, timeout=5)
+            if not isinstance(future, asyncio.Future):
+                logger.error("[%s] Dynamic executor start failed, reply: %s", execute_id, future)
+                return
             result = await asyncio.wait_for(future, timeout=300)
             logger.info("[%s] Dynamic executor executed, result: %s", execute_id, result)
         except asyncio.TimeoutError as exc:
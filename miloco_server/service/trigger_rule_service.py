@@ -5,6 +5,7 @@
 Trigger rule service module
 """
 
+import asyncio
 import logging
 from typing import List, Optional
 
@@ -69,13 +70,7 @@ class TriggerRuleService:
             raise ConflictException(f"Trigger rule name '{trigger_rule.name}' already exists")
 
         # Validate if camera device IDs are valid
-        valid_cameras = await self._miot_proxy.get_camera_dids()
-        invalid_dids = [
-            did for did in trigger_rule.cameras if did not in valid_cameras
-        ]
-        if invalid_dids:
-            ids = ", ".join(invalid_dids)
-            raise ValidationException(f"Invalid camera device IDs: {ids}")
+        await self._check_camera_dids(trigger_rule.cameras)
 
         # Validate notification for content filtering
         if trigger_rule.execute_info and trigger_rule.execute_info.notify:
@@ -161,22 +156,17 @@ class TriggerRuleService:
         if not trigger_rule.id:
             raise ValidationException("Rule ID is required")
 
-        # Check if rule exists
-        if not self._trigger_rule_dao.exists(trigger_rule.id):
+        # Check if rule exists and rule name already exists (excluding current rule)
+        rule_exists, name_taken = self._trigger_rule_dao.validate_upsert(
+            trigger_rule.name, trigger_rule.id)
+        if not rule_exists:
             raise ResourceNotFoundException(f"Trigger rule with ID '{trigger_rule.id}' not found")
 
-        # Check if rule name already exists (excluding current rule)
-        if self._trigger_rule_dao.exists_by_name(trigger_rule.name, trigger_rule.id):
+        if name_taken:
             raise ConflictException(f"Trigger rule name '{trigger_rule.name}' already exists")
 
         # Validate if camera device IDs are valid
-        valid_cameras = await self._miot_proxy.get_camera_dids()
-        invalid_dids = [
-            did for did in trigger_rule.cameras if did not in valid_cameras
-        ]
-        if invalid_dids:
-            ids = ", ".join(invalid_dids)
-            raise ValidationException(f"Invalid camera device IDs: {ids}")
+        await self._check_camera_dids(trigger_rule.cameras)
 
         # Validate notification for content filtering
         if trigger_rule.execute_info and trigger_rule.execute_info.notify:
@@ -241,6 +231,14 @@ class TriggerRuleService:
         logger.info("Retrieved %d trigger rule logs", len(rule_logs))
         return rule_logs, total_items
 
+    async def _check_camera_dids(self, camera_dids: List[str]):
+        """Check camera device IDs are all known cameras"""
+        valid_cameras = set(await self._miot_proxy.get_camera_dids())
+        invalid_dids = [did for did in camera_dids if did not in valid_cameras]
+        if invalid_dids:
+            ids = ", ".join(invalid_dids)
+            raise ValidationException(f"Invalid camera device IDs: {ids}")
+
     async def _check_notify(self, notify: Optional[Notify]):
         """Check notification content for filtering"""
         if not notify:
@@ -258,25 +256,29 @@ class TriggerRuleService:
     async def make_trigger_rule_details(
             self, trigger_rules: List[TriggerRule]) -> List[TriggerRuleDetail]:
         """Generate trigger rule response"""
-        camera_info_dict = await self._miot_proxy.get_cameras()
-        all_mcp_list = await self._mcp_client_manager.get_all_clients_status()
+        camera_info_dict, all_mcp_list = await asyncio.gather(
+            self._miot_proxy.get_cameras(),
+            self._mcp_client_manager.get_all_clients_status())
+        # Index MCP clients once for all rules
+        all_mcp_dict = {client.client_id: client for client in all_mcp_list}
         return [
-            self._build_trigger_rule_detail(trigger_rule, camera_info_dict, all_mcp_list)
+            self._build_trigger_rule_detail(trigger_rule, camera_info_dict, all_mcp_dict)
             for trigger_rule in trigger_rules
         ]
 
 
     async def make_trigger_rule_detail(self, trigger_rule: TriggerRule) -> TriggerRuleDetail:
         """Generate trigger rule response"""
-        camera_info_dict = await self._miot_proxy.get_cameras()
-        all_mcp_list = await self._mcp_client_manager.get_all_clients_status()
+        camera_info_dict, all_mcp_list = await asyncio.gather(
+            self._miot_proxy.get_cameras(),
+            self._mcp_client_manager.get_all_clients_status())
         return self._build_trigger_rule_detail(trigger_rule, camera_info_dict, all_mcp_list)
 
     def _build_trigger_rule_detail(
         self,
         trigger_rule: TriggerRule,
         camera_info_dict: dict[str, MIoTCameraInfo],
-        all_mcp_list: List[MCPClientStatus],
+        all_mcp_list: List[MCPClientStatus] | dict[str, MCPClientStatus],
     ) -> TriggerRuleDetail:
         """Generate trigger rule response"""
         camera_list = choose_camera_list(trigger_rule.cameras, camera_info_dict)
@@ -309,8 +311,7 @@ class TriggerRuleService:
 
     async def execute_actions(self, actions: list[Action]) -> list[bool]:
         """Execute actions"""
-        results: list[bool] = []
-        for action in actions:
-            result: bool = await self._trigger_rule_runner.execute_action(action)
-            results.append(result)
-        return results
+        # execute_action handles its own errors, results keep the order of actions
+        results: list[bool] = await asyncio.gather(
+            *[self._trigger_rule_runner.execute_action(action) for action in actions])
+        return list(results)
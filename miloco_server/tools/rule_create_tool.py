@@ -107,13 +107,15 @@ class RuleCreateTool(Actor):
             notify = name
 
         try:
-            chosen_camera_infos, all_camera_infos = await self._choose_camera(location)
+            # Camera choice and preset action lists are independent, fetch them together
+            (chosen_camera_infos, all_camera_infos), miot_scene_actions, ha_automation_actions = (
+                await asyncio.gather(
+                    self._choose_camera(location),
+                    self._default_preset_action_manager.get_miot_scene_actions(),
+                    self._default_preset_action_manager.get_ha_automation_actions()))
             if not chosen_camera_infos:
                 chosen_camera_infos = all_camera_infos
 
-            miot_scene_actions = await self._default_preset_action_manager.get_miot_scene_actions()
-            ha_automation_actions = await self._default_preset_action_manager.get_ha_automation_actions()
-
             no_matched_action_descriptions, matched_actions = (
                 await self._action_descriptions_to_preset_actions(
                     action_descriptions, miot_scene_actions, ha_automation_actions))
@@ -5,7 +5,7 @@
 
 import asyncio
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pydantic.dataclasses import dataclass
 from miloco_server.schema.miot_schema import CameraImgSeq
@@ -13,9 +13,15 @@ from thespian.actors import Actor, ActorAddress, ActorExitRequest
 
 from miloco_server import actor_system
 from miloco_server.config import CHAT_CONFIG
+from miloco_server.schema.auth_schema import UserLanguage
 from miloco_server.schema.chat_schema import Dialog, InstructionPayload, Template
 from miloco_server.utils.llm_utils.device_chooser import DeviceChooser
 from miloco_server.utils.llm_utils.vision_understander import VisionUnderstander
+
+if TYPE_CHECKING:
+    # Runtime import would cycle back through the MCP client manager
+    from miloco_server.service.miot_service import MiotService
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,11 +41,12 @@ class VisionChatTool(Actor):
         location_info: Optional[str],
         user_choosed_camera_dids: list[str],
         camera_images: Optional[list[CameraImgSeq]],
+        miot_service: "MiotService",
+        language: UserLanguage,
     ):
         """Initialize ReAct agent Actor"""
         super().__init__()
-        from miloco_server.service.manager import get_manager # pylint: disable=import-outside-toplevel
-        self._manager = get_manager()
+        self._miot_service = miot_service
 
         self._request_id = request_id
         self._query = query
@@ -47,7 +54,7 @@ class VisionChatTool(Actor):
         self._user_choosed_camera_dids = user_choosed_camera_dids
         self._out_actor_address = out_actor_address
         self._future = None
-        self._language = self._manager.auth_service.get_user_language().language
+        self._language = language
         self._vision_use_img_count = CHAT_CONFIG["vision_use_img_count"]
         self._camera_images: Optional[list[CameraImgSeq]] = camera_images
         logger.info("[%s] VisionChatTool initialized", self._request_id)
@@ -93,8 +100,8 @@ class VisionChatTool(Actor):
                     camera_list = all_cameras
 
                 camera_dids = [camera.did for camera in camera_list]
-                camera_img_seqs = await self._manager.miot_service.get_miot_cameras_img(
-                    camera_dids, self._vision_use_img_count)
+                camera_img_seqs = await self._miot_service.get_miot_cameras_img(
+                    camera_dids, self._vision_use_img_count, online_only=True)
 
                 logger.info("[%s] Got %d camera image sequences, camera_infos: %s, img_counts: %s",
                         self._request_id,
@@ -102,11 +109,6 @@ class VisionChatTool(Actor):
                         [camera_img_seq.camera_info for camera_img_seq in camera_img_seqs],
                         [len(camera_img_seq.img_list) for camera_img_seq in camera_img_seqs])
 
-                camera_img_seqs = [
-                    camera_img_seq for camera_img_seq in camera_img_seqs
-                    if camera_img_seq.camera_info.online and len(camera_img_seq.img_list) > 0
-                ]
-
             if len(camera_img_seqs) == 0:
                 self._future.set_result({"error": "No camera images found, please check cameras are working"})
                 return
@@ -9,9 +9,9 @@ Provides functionality to handle camera image queues and vision processing.
 import asyncio
 import logging
 import time
-import threading
 from collections import deque
-from typing import Any, Callable, Coroutine, List
+from itertools import islice
+from typing import Any, Callable, Coroutine, List, Optional
 
 from miloco_server.schema.miot_schema import CameraImgInfo, CameraImgSeq, CameraInfo
 from miot.camera import MIoTCameraInstance
@@ -21,7 +21,11 @@ logger = logging.getLogger(__name__)
 
 
 class SizeLimitedQueue:
-    """Size-limited queue that automatically removes oldest elements"""
+    """Size-limited queue that automatically removes oldest elements
+
+    Only accessed from the event loop (decode callbacks and frame readers are
+    coroutines or sync calls made on the loop), so no locking is needed.
+    """
 
     def __init__(self, max_size: int, ttl: int):
         if max_size <= 0:
@@ -30,69 +34,69 @@ class SizeLimitedQueue:
             raise ValueError("ttl must be positive")
         self.max_size = max_size
         self.ttl = ttl
-        self.queue = deque(maxlen=max_size)
-        self._lock = threading.Lock()
-
-    def _filter_old_items(self) -> None:
-        """Filter old items"""
-        current_time = time.time()
-        while self.queue and current_time - self.queue[0][1] > self.ttl:
-            self.queue.popleft()
+        # Items and their monotonic insertion times are kept in parallel deques, avoiding
+        # a tuple per queued frame; both drop their oldest entry together when full
+        self.items = deque(maxlen=max_size)
+        self.timestamps = deque(maxlen=max_size)
+
+    def _filter_old_items(self, current_time: Optional[float] = None) -> None:
+        """Filter old items, items are in insertion order so only the head can be expired"""
+        if current_time is None:
+            current_time = time.monotonic()
+        while self.timestamps and current_time - self.timestamps[0] > self.ttl:
+            self.timestamps.popleft()
+            self.items.popleft()
 
     def clear(self) -> None:
         """Clear queue"""
-        with self._lock:
-            self.queue.clear()
+        self.items.clear()
+        self.timestamps.clear()
 
     def put(self, item: Any) -> None:
         """Add element, automatically removes oldest element if queue is full"""
-        with self._lock:
-            self._filter_old_items()
-            self.queue.append((item, time.time()))
+        current_time = time.monotonic()
+        self._filter_old_items(current_time)
+        self.items.append(item)
+        self.timestamps.append(current_time)
 
     def get(self) -> Any:
         """Get and remove the oldest element"""
-        with self._lock:
-            if not self.queue:
-                raise IndexError("Queue is empty")
-            self._filter_old_items()
-            if not self.queue:
-                raise IndexError("Queue is empty after filtering")
-            return self.queue.popleft()[0]
+        if not self.items:
+            raise IndexError("Queue is empty")
+        self._filter_old_items()
+        if not self.items:
+            raise IndexError("Queue is empty after filtering")
+        self.timestamps.popleft()
+        return self.items.popleft()
 
     def peek(self) -> Any:
         """View the oldest element without removing it"""
-        with self._lock:
-            if not self.queue:
-                raise IndexError("Queue is empty")
-            self._filter_old_items()
-            if not self.queue:
-                raise IndexError("Queue is empty after filtering")
-            return self.queue[0][0]
+        if not self.items:
+            raise IndexError("Queue is empty")
+        self._filter_old_items()
+        if not self.items:
+            raise IndexError("Queue is empty after filtering")
+        return self.items[0]
 
     def size(self) -> int:
         """Return current queue size"""
-        with self._lock:
-            self._filter_old_items()
-            return len(self.queue)
+        self._filter_old_items()
+        return len(self.items)
 
     def is_empty(self) -> bool:
         """Check if queue is empty"""
-        with self._lock:
-            self._filter_old_items()
-            return len(self.queue) == 0
+        self._filter_old_items()
+        return len(self.items) == 0
 
     def is_full(self) -> bool:
         """Check if queue is full"""
-        with self._lock:
-            self._filter_old_items()
-            return len(self.queue) == self.max_size
+        self._filter_old_items()
+        return len(self.items) == self.max_size
 
     def to_list(self) -> List[Any]:
         """Convert to list, from oldest to newest"""
-        with self._lock:
-            self._filter_old_items()
-            return [item[0] for item in self.queue]
+        self._filter_old_items()
+        return list(self.items)
 
     def get_recent(self, n: int) -> List[Any]:
         """Get the most recent n elements, sorted by time from old to new
@@ -106,13 +110,11 @@ class SizeLimitedQueue:
         if n <= 0:
             return []
 
-        with self._lock:
-            # Get the most recent n elements, starting from the tail of the queue
-            self._filter_old_items()
-            actual_n = min(n, len(self.queue))
-            # Use negative indexing to get from the end of the queue, maintaining order from old to new
-            recent_items = [item[0] for item in self.queue][-actual_n:]
-            return recent_items
+        # Get the most recent n elements, starting from the tail of the queue
+        self._filter_old_items()
+        actual_n = min(n, len(self.items))
+        # Only walk the last actual_n items, maintaining order from old to new
+        return list(islice(self.items, len(self.items) - actual_n, None))
 
 
 class CameraVisionHandler:
@@ -121,10 +123,16 @@ class CameraVisionHandler:
     def __init__(self, camera_info: MIoTCameraInfo, miot_camera_instance: MIoTCameraInstance, max_size: int, ttl: int):
         # ttl seconds
         self.camera_info = camera_info
+        # Converted once per camera info change, shared by every returned sequence
+        self._camera_info_view = CameraInfo.model_validate(camera_info.model_dump())
         self.miot_camera_instance = miot_camera_instance
         self.camera_img_queues: dict[int, SizeLimitedQueue] = {}
+        # Queues are created once, channels stay fixed for the handler lifetime
+        self._channels = range(self.camera_info.channel_count or 1)
+        # Decode callbacks are registered below regardless of the initial state
+        self._decode_registered = True
 
-        for channel in range(self.camera_info.channel_count or 1):
+        for channel in self._channels:
             self.camera_img_queues[channel] = SizeLimitedQueue(max_size=max_size, ttl=ttl)
             asyncio.create_task(self.miot_camera_instance.register_decode_jpg_async(self.add_camera_img, channel))
 
@@ -142,28 +150,32 @@ class CameraVisionHandler:
 
     async def update_camera_info(self, camera_info: MIoTCameraInfo) -> None:
         self.camera_info = camera_info
-        if self.camera_info.online:
-            for channel in range(self.camera_info.channel_count or 1):
+        self._camera_info_view = CameraInfo.model_validate(camera_info.model_dump())
+        # Only touch decode callbacks when the online state transitions
+        if self.camera_info.online and not self._decode_registered:
+            for channel in self._channels:
                 await self.miot_camera_instance.register_decode_jpg_async(self.add_camera_img, channel)
-        else:
-            for channel in range(self.camera_info.channel_count or 1):
+            self._decode_registered = True
+        elif not self.camera_info.online and self._decode_registered:
+            for channel in self._channels:
                 await self.miot_camera_instance.unregister_decode_jpg_async(channel)
                 self.camera_img_queues[channel].clear()
+            self._decode_registered = False
 
     def get_recents_camera_img(self, channel: int, n: int) -> CameraImgSeq:
         if self.camera_info.online:
             return CameraImgSeq(
-                camera_info=CameraInfo.model_validate(self.camera_info.model_dump()),
+                camera_info=self._camera_info_view,
                 channel=channel,
                 img_list=self.camera_img_queues[channel].get_recent(n))
         else:
             return CameraImgSeq(
-                camera_info=CameraInfo.model_validate(self.camera_info.model_dump()),
+                camera_info=self._camera_info_view,
                 channel=channel,
                 img_list=[])
 
     async def destroy(self) -> None:
-        for channel in range(self.camera_info.channel_count or 1):
+        for channel in self._channels:
             await self.miot_camera_instance.unregister_decode_jpg_async(channel=channel)
             await self.miot_camera_instance.unregister_raw_video_async(channel=channel)
             self.camera_img_queues[channel].clear()
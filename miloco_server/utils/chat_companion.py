@@ -68,9 +68,9 @@ class ChatCompanion:
         if current_chat_data is None:
             self._chat_data_map[request_id] = chat_data
         else:
-            for field_name, field_value in chat_data.__dict__.items():
-                if field_value is not None:
-                    setattr(current_chat_data, field_name, field_value)
+            # Merge non-None fields in one dict update
+            current_chat_data.__dict__.update(
+                {name: value for name, value in chat_data.__dict__.items() if value is not None})
 
     def clear_chat_data(self, request_id: str):
         """
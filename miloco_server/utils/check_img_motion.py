@@ -6,49 +6,98 @@ Image motion detection utility.
 Provides functionality to detect motion between images using DHash algorithm.
 """
 
+import asyncio
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import imagehash
+import numpy as np
 from PIL import Image
 
+from miloco_server.schema.miot_schema import CameraImgInfo
+
 logger = logging.getLogger(name=__name__)
 
 HASH_SIZE = 16
 THRESHOLD = 5
 
+# Dedicated pool for JPEG decoding, so bursts of frames do not occupy the
+# default executor used for database writes
+_HASH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dhash")
+
 
 class CheckImgMotionByDHash:
     """Image motion detection using DHash algorithm"""
 
     @staticmethod
-    def _calculate_dhash(image_src) -> Optional[imagehash.ImageHash]:
-        """Calculate DHash value of image using imagehash library"""
+    def _dhash_kernel(pixels: np.ndarray) -> np.ndarray:
+        """Compare horizontally adjacent pixels of a (HASH_SIZE, HASH_SIZE + 1) grayscale array"""
+        # Pack the 256 comparison bits into 32 bytes in one vectorized pass
+        return np.packbits(pixels[:, 1:] > pixels[:, :-1])
+
+    @staticmethod
+    def _calculate_dhash(image_src) -> Optional[int]:
+        """Calculate DHash of image as a 256-bit int, PIL releases the GIL while decoding and resizing"""
         try:
-            if isinstance(image_src, bytes):
-                img = Image.open(io.BytesIO(image_src))
-            else:
-                img = Image.open(image_src)
-            return imagehash.dhash(img, hash_size=HASH_SIZE)
+            # BytesIO shares the buffer of bytes, no copy of the frame is made
+            if isinstance(image_src, (bytes, bytearray, memoryview)):
+                image_src = io.BytesIO(image_src)
+            with Image.open(image_src) as img:
+                # Let libjpeg downscale in the DCT domain while decoding, no-op for other formats
+                img.draft("L", (HASH_SIZE * 4, HASH_SIZE * 4))
+                gray = img.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.LANCZOS)
+            pixels = np.ascontiguousarray(gray, dtype=np.uint8)
+            return int.from_bytes(CheckImgMotionByDHash._dhash_kernel(pixels).tobytes(), "big")
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("Error calculating DHash: %s", e)
             return None
 
     @staticmethod
-    def is_image_changed(image1_src, image2_src) -> tuple[bool, int]:
-        """
-        Check if two images have changed
-        """
-        hash1 = CheckImgMotionByDHash._calculate_dhash(image1_src)
-        hash2 = CheckImgMotionByDHash._calculate_dhash(image2_src)
+    def hash_of(image_src) -> Optional[int]:
+        """Get DHash of image, frames from the camera queue keep their hash across checks"""
+        if isinstance(image_src, CameraImgInfo):
+            if image_src.dhash is None:
+                image_src.dhash = CheckImgMotionByDHash._calculate_dhash(image_src.data)
+            return image_src.dhash
+        return CheckImgMotionByDHash._calculate_dhash(image_src)
+
+    @staticmethod
+    async def hash_of_async(image_src) -> Optional[int]:
+        """Get DHash of image, decoding in a worker thread unless the hash is cached"""
+        if isinstance(image_src, CameraImgInfo) and image_src.dhash is not None:
+            return image_src.dhash
+        return await asyncio.get_running_loop().run_in_executor(
+            _HASH_EXECUTOR, CheckImgMotionByDHash.hash_of, image_src)
+
+    @staticmethod
+    def _compare_hashes(hash1: Optional[int], hash2: Optional[int]) -> tuple[bool, int]:
         if hash1 is None or hash2 is None:
             return (False, -1)  # Processing failed
-        # Calculate Hamming distance, imagehash library supports direct hash subtraction
-        distance = hash1 - hash2
+        # Hamming distance is the count of differing hash bits
+        distance = (hash1 ^ hash2).bit_count()
         changed = distance > THRESHOLD
         return (changed, distance)
 
+    @staticmethod
+    def is_image_changed(image1_src, image2_src) -> tuple[bool, int]:
+        """
+        Check if two images have changed
+        """
+        return CheckImgMotionByDHash._compare_hashes(
+            CheckImgMotionByDHash.hash_of(image1_src),
+            CheckImgMotionByDHash.hash_of(image2_src))
+
+    @staticmethod
+    async def is_image_changed_async(image1_src, image2_src) -> tuple[bool, int]:
+        """
+        Check if two images have changed, both images are decoded concurrently
+        """
+        hash1, hash2 = await asyncio.gather(
+            CheckImgMotionByDHash.hash_of_async(image1_src),
+            CheckImgMotionByDHash.hash_of_async(image2_src))
+        return CheckImgMotionByDHash._compare_hashes(hash1, hash2)
+
 
 def check_camera_motion(image1_src, image2_src) -> bool:
     """
@@ -56,3 +105,33 @@ def check_camera_motion(image1_src, image2_src) -> bool:
     """
     motion, _ = CheckImgMotionByDHash.is_image_changed(image1_src, image2_src)
     return motion
+
+
+async def check_camera_motion_async(image1_src, image2_src) -> bool:
+    """
+    Check if camera image has changed, without blocking the event loop
+    """
+    motion, _ = await CheckImgMotionByDHash.is_image_changed_async(image1_src, image2_src)
+    return motion
+
+
+def check_camera_img_seq_same(image_src_list1, image_src_list2) -> bool:
+    """
+    Check if two camera image sequences show the same scene,
+    every frame pair must be within the motion threshold
+    """
+    if not image_src_list1 or len(image_src_list1) != len(image_src_list2):
+        return False
+    for image1_src, image2_src in zip(image_src_list1, image_src_list2):
+        changed, distance = CheckImgMotionByDHash.is_image_changed(image1_src, image2_src)
+        if changed or distance < 0:
+            return False
+    return True
+
+
+async def check_camera_img_seq_same_async(image_src_list1, image_src_list2) -> bool:
+    """
+    Check if two camera image sequences show the same scene, in the image hashing pool
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _HASH_EXECUTOR, check_camera_img_seq_same, image_src_list1, image_src_list2)
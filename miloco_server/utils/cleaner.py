@@ -7,16 +7,19 @@ Provides functionality to clean up chat history, trigger rule logs and image fil
 """
 
 import asyncio
+import json
 import logging
+import time
+from typing import Coroutine
 
 from miloco_server.config.normal_config import CHAT_CONFIG, TRIGGER_RULE_RUNNER_CONFIG
 from miloco_server.dao.chat_history_dao import ChatHistoryDAO
+from miloco_server.dao.kv_dao import KVDao, SystemConfigKeys
 from miloco_server.dao.trigger_rule_log_dao import TriggerRuleLogDAO
 from miloco_server.schema.chat_history_schema import ChatHistorySession
-from miloco_server.schema.chat_schema import Instruction, Template
-from miloco_server.schema.miot_schema import CameraImgPathSeq
+from miloco_server.schema.chat_schema import Instruction
 from miloco_server.schema.trigger_log_schema import TriggerRuleLog
-from miloco_server.utils.media import image_manager
+from miloco_server.utils.media import get_image_manager
 
 logger = logging.getLogger(__name__)
 
@@ -24,46 +27,88 @@ logger = logging.getLogger(__name__)
 class Cleaner:
     """Cleaner for managing data cleanup tasks"""
 
+    # Expired records are fetched, cleaned and deleted in chunks of this size
+    _CLEAN_CHUNK_SIZE = 1000
+    _CLEAN_INTERVAL = 24 * 60 * 60
+    _RETRY_INTERVAL = 60 * 60
+
     def __init__(self, chat_history_dao: ChatHistoryDAO,
-                 trigger_rule_log_dao: TriggerRuleLogDAO):
+                 trigger_rule_log_dao: TriggerRuleLogDAO,
+                 kv_dao: KVDao):
         self._chat_history_dao = chat_history_dao
         self._trigger_rule_log_dao = trigger_rule_log_dao
+        self._kv_dao = kv_dao
         self._chat_history_ttl = CHAT_CONFIG["chat_history_ttl"]
         self._trigger_rule_log_ttl = TRIGGER_RULE_RUNNER_CONFIG["trigger_rule_log_ttl"]
+        # Bound concurrent session image cleanups so a large sweep does not thrash the disk
+        self._delete_semaphore = asyncio.Semaphore(32)
 
         # Start scheduled cleanup task
         asyncio.create_task(self._cleanup_loop())
         logger.info("Cleaner started")
 
+    def _seconds_until_next_cleanup(self) -> float:
+        """Time left until the next cleanup, based on the persisted last run"""
+        last_cleanup_ts = self._kv_dao.get(SystemConfigKeys.LAST_CLEANUP_TS_KEY)
+        try:
+            elapsed = time.time() - float(last_cleanup_ts)
+        except (TypeError, ValueError):
+            return 0
+        # Clamp so a clock set backwards does not postpone cleanup indefinitely
+        return min(max(0.0, self._CLEAN_INTERVAL - elapsed), self._CLEAN_INTERVAL)
+
     async def _cleanup_loop(self):
-        """Async cleanup loop"""
+        """Async cleanup loop, runs once per interval across restarts"""
         while True:
+            await asyncio.sleep(self._seconds_until_next_cleanup())
             try:
-                await self._clean_chat_history(self._chat_history_ttl)
-                await self._clean_trigger_rule_log(self._trigger_rule_log_ttl)
-                # Wait 24 hours
-                await asyncio.sleep(24 * 60 * 60)
+                # Chat history and trigger rule logs are independent tables and images
+                await asyncio.gather(
+                    self._clean_chat_history(self._chat_history_ttl),
+                    self._clean_trigger_rule_log(self._trigger_rule_log_ttl))
+                self._kv_dao.set(SystemConfigKeys.LAST_CLEANUP_TS_KEY, str(time.time()))
             except Exception as e:  # pylint: disable=broad-exception-caught
                 logger.error("Cleanup error: %s", e)
-                await asyncio.sleep(60 * 60)  # Wait 1 hour after error
+                await asyncio.sleep(self._RETRY_INTERVAL)  # Wait 1 hour after error
 
     async def _clean_chat_history(self, days: int):
-        # Execute cleanup immediately
-        need_delete = self._chat_history_dao.get_records_before_days(days)
-        if not need_delete:
-            return
-
-        for chat_history in need_delete:
-            history = self._chat_history_dao.get_by_id(
-                chat_history.session_id)
-            if history is not None and history.session is not None:
-                await self._clean_chat_history_session(
-                    history.session)
-
-        need_delete_ids = [chat_history.session_id for chat_history in need_delete]
-        self._chat_history_dao.delete_by_ids(need_delete_ids)
-        logger.info("Cleanup: deleted %d old records", len(need_delete))
-
+        # Execute cleanup immediately, one chunk of the oldest records at a time.
+        # Each chunk is deleted before fetching again, so the same query returns the next one
+        deleted_count = 0
+        while True:
+            need_delete = self._chat_history_dao.get_sessions_before_days(
+                days, limit=self._CLEAN_CHUNK_SIZE)
+            if not need_delete:
+                break
+
+            await self._run_bounded([
+                self._clean_chat_history_session(session)
+                for _, session in need_delete if session is not None
+            ])
+
+            need_delete_ids = [session_id for session_id, _ in need_delete]
+            if not self._chat_history_dao.delete_by_ids(need_delete_ids):
+                # Stop instead of fetching the same chunk again
+                break
+            deleted_count += len(need_delete)
+            if len(need_delete) < self._CLEAN_CHUNK_SIZE:
+                break
+
+        if deleted_count:
+            logger.info("Cleanup: deleted %d old records", deleted_count)
+
+
+    async def _run_bounded(self, coros: list[Coroutine]):
+        """Run image cleanups under the semaphore, logging failures as each one finishes"""
+        async def _bounded(coro: Coroutine):
+            async with self._delete_semaphore:
+                return await coro
+
+        for future in asyncio.as_completed([_bounded(coro) for coro in coros]):
+            try:
+                await future
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Cleanup image deletion error: %s", e)
 
     async def _clean_chat_history_session(self, session: ChatHistorySession):
         """
@@ -76,10 +121,16 @@ class Cleaner:
 
     async def _clean_instruction_images(self, instruction: Instruction):
         if instruction.judge_type("Template", "CameraImages"):
-            payload = Template.CameraImages.model_validate_json(
-                instruction.payload)
-            await self._clean_image_path_seq_list(
-                payload.image_path_seq_list)
+            # Only image paths are needed, skip validating the whole payload models
+            payload = json.loads(instruction.payload)
+            image_names = [
+                image["data"]
+                for image_path_seq in payload.get("image_path_seq_list", [])
+                for image in image_path_seq.get("img_list", [])
+            ]
+            if image_names:
+                # Runs inside a bounded session cleanup, so no semaphore here
+                await get_image_manager().delete_image_list_async(image_names)
 
 
     async def _clean_trigger_rule_log(self, days: int):
@@ -87,11 +138,18 @@ class Cleaner:
         Clean up trigger rule logs
         """
         try:
-            logs: list[TriggerRuleLog] = self._trigger_rule_log_dao.get_logs_before_days(days)
-            await self._clean_trigger_rule_log_condition_images(logs)
-            await self._clean_trigger_rule_log_execute_result_images(logs)
-            log_ids = [log.id for log in logs if log.id is not None]
-            self._trigger_rule_log_dao.delete_by_ids(log_ids)
+            while True:
+                logs: list[TriggerRuleLog] = self._trigger_rule_log_dao.get_logs_before_days(
+                    days, limit=self._CLEAN_CHUNK_SIZE)
+                if not logs:
+                    break
+                await self._clean_trigger_rule_log_condition_images(logs)
+                await self._clean_trigger_rule_log_execute_result_images(logs)
+                log_ids = [log.id for log in logs if log.id is not None]
+                if not self._trigger_rule_log_dao.delete_by_ids(log_ids):
+                    break
+                if len(logs) < self._CLEAN_CHUNK_SIZE:
+                    break
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("Error cleaning trigger rule log: %s",
                          e, exc_info=True)
@@ -103,16 +161,19 @@ class Cleaner:
         if not logs:
             return
 
-        tasks = []
-        for log in logs:
-            for camera_condition_result in log.condition_results:
-                if camera_condition_result.images:
-                    tasks.append(
-                        image_manager.delete_image_list_async([
-                            image.data
-                            for image in camera_condition_result.images
-                        ]))
-        await asyncio.gather(*tasks)
+        # All condition images of the sweep are deleted in one batch
+        image_names = [
+            image.data
+            for log in logs
+            for camera_condition_result in log.condition_results
+            for image in camera_condition_result.images or []
+        ]
+        if not image_names:
+            return
+        try:
+            await get_image_manager().delete_image_list_async(image_names)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Cleanup image deletion error: %s", e)
 
     async def _clean_trigger_rule_log_execute_result_images(self, logs: list[TriggerRuleLog]):
         """
@@ -120,19 +181,9 @@ class Cleaner:
         """
         if not logs:
             return
-        for log in logs:
-            if log.execute_result and log.execute_result.ai_recommend_dynamic_execute_result:
-                execute_result = log.execute_result.ai_recommend_dynamic_execute_result
-                await self._clean_chat_history_session(execute_result.chat_history_session)
-
-
-    async def _clean_image_path_seq_list(
-            self, image_path_seq_list: list[CameraImgPathSeq]):
-        """
-        Clean up image files
-        """
-        logger.info("start to _clean_image_path_seq_list %s", image_path_seq_list)
-        tasks = []
-        for image_path_seq in image_path_seq_list:
-            tasks.append(image_path_seq.delete_image_list_async())
-        await asyncio.gather(*tasks)
+        await self._run_bounded([
+            self._clean_chat_history_session(
+                log.execute_result.ai_recommend_dynamic_execute_result.chat_history_session)
+            for log in logs
+            if log.execute_result and log.execute_result.ai_recommend_dynamic_execute_result
+        ])
@@ -8,8 +8,9 @@ Responsible for database initialization, connection management and basic operati
 
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from miloco_server.config import DATABASE_CONFIG
 
@@ -17,6 +18,93 @@ from miloco_server.config import DATABASE_CONFIG
 logger = logging.getLogger(__name__)
 
 
+# Tables and indexes, every statement is idempotent
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS kv (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        key TEXT UNIQUE NOT NULL,
+        value TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_kv_key ON kv(key);
+
+    CREATE TABLE IF NOT EXISTS trigger_rule (
+        id TEXT PRIMARY KEY,  -- Use UUID as primary key, no longer auto-increment
+        name TEXT NOT NULL,
+        enabled BOOLEAN DEFAULT 1,
+        camera_dids TEXT NOT NULL,  -- JSON format storage for camera device ID list
+        condition TEXT NOT NULL,    -- Trigger condition
+        execute_info TEXT,          -- JSON format storage for ExecuteInfo object
+        filter TEXT,                 -- JSON format storage for TriggerFilter object
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_trigger_rule_name ON trigger_rule(name);
+    CREATE INDEX IF NOT EXISTS idx_trigger_rule_enabled ON trigger_rule(enabled);
+
+    CREATE TABLE IF NOT EXISTS trigger_rule_log (
+        id TEXT PRIMARY KEY,  -- Use UUID as primary key
+        timestamp INTEGER NOT NULL,  -- Trigger time (millisecond Unix timestamp)
+        trigger_rule_id TEXT NOT NULL,  -- Trigger rule ID
+        trigger_rule_name TEXT NOT NULL,  -- Trigger rule name
+        trigger_rule_condition TEXT NOT NULL,  -- Trigger rule condition
+        camera_condition_results TEXT NOT NULL,  -- JSON format storage for camera trigger condition result list
+        execute_result TEXT,  -- JSON format storage for ExecuteResult object
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_trigger_rule_log_timestamp ON trigger_rule_log(timestamp);
+    CREATE INDEX IF NOT EXISTS idx_trigger_rule_log_rule_id ON trigger_rule_log(trigger_rule_id);
+    CREATE INDEX IF NOT EXISTS idx_trigger_rule_log_created_at ON trigger_rule_log(created_at);
+
+    CREATE TABLE IF NOT EXISTS model_vendor (
+        id TEXT PRIMARY KEY,  -- Use UUID as primary key
+        base_url TEXT NOT NULL,
+        api_key TEXT NOT NULL,
+        model_name TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_model_vendor_model_name ON model_vendor(model_name);
+    CREATE INDEX IF NOT EXISTS idx_model_vendor_base_url ON model_vendor(base_url);
+
+    CREATE TABLE IF NOT EXISTS mcp_config (
+        id TEXT PRIMARY KEY,  -- Use UUID as primary key
+        access_type TEXT NOT NULL,  -- Access type: http_sse, streamable_http, stdio
+        name TEXT NOT NULL,  -- Service name
+        description TEXT DEFAULT '',  -- Service description
+        provider TEXT DEFAULT '',  -- Provider
+        provider_website TEXT DEFAULT '',  -- Provider website
+        timeout INTEGER DEFAULT 60,  -- Timeout setting (seconds)
+        enable BOOLEAN DEFAULT 1,  -- Enable status: 1=enabled, 0=disabled
+        url TEXT,  -- Service URL (used by HTTP/SSE and Streamable HTTP)
+        request_header_token TEXT,  -- Request header Token (used by HTTP/SSE and Streamable HTTP)
+        command TEXT,  -- Command (used by Stdio)
+        args TEXT,  -- Parameter list JSON format (used by Stdio)
+        env_vars TEXT,  -- Environment variables JSON format (used by Stdio)
+        working_directory TEXT,  -- Working directory (used by Stdio)
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_mcp_config_name ON mcp_config(name);
+    CREATE INDEX IF NOT EXISTS idx_mcp_config_access_type ON mcp_config(access_type);
+    CREATE INDEX IF NOT EXISTS idx_mcp_config_provider ON mcp_config(provider);
+
+    CREATE TABLE IF NOT EXISTS chat_history (
+        session_id TEXT PRIMARY KEY,  -- Use UUID as primary key
+        title TEXT NOT NULL,  -- Conversation title
+        timestamp INTEGER NOT NULL,  -- Timestamp
+        messages TEXT,  -- JSON format storage for message content
+        session TEXT,  -- JSON format storage for session content
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_chat_history_title ON chat_history(title);
+    CREATE INDEX IF NOT EXISTS idx_chat_history_created_at ON chat_history(created_at);
+    CREATE INDEX IF NOT EXISTS idx_chat_history_timestamp ON chat_history(timestamp);
+"""
+
+
 class SQLiteConnector:
     """SQLite database connector class"""
 
@@ -27,6 +115,8 @@ class SQLiteConnector:
         self.check_same_thread = DATABASE_CONFIG["check_same_thread"]
         self.isolation_level = DATABASE_CONFIG["isolation_level"]
         self._connection: Optional[sqlite3.Connection] = None
+        # One connection is shared by the event loop and worker threads
+        self._lock = threading.RLock()
 
     def initialize_database(self) -> None:
         """Initialize database, create necessary directories and tables"""
@@ -34,283 +124,86 @@ class SQLiteConnector:
             # Ensure database directory exists
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Check if database file already exists
             if self.db_path.exists():
                 logger.info("Database file already exists: %s", self.db_path)
-                # Verify existing database connectivity and check necessary tables
-                with self.get_connection() as conn:
-                    # Get list of tables in current database
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table'")
-                    existing_tables = {row[0] for row in cursor.fetchall()}
-                    logger.info(
-                        "Found %d tables in existing database: %s",
-                        len(existing_tables), existing_tables
-                    )
-
-                    # Check if necessary tables exist, create if not
-                    tables_created = []
-
-                    if "kv" not in existing_tables:
-                        logger.info("KV table not found, creating...")
-                        self._create_kv_table(conn)
-                        tables_created.append("kv")
-
-                    if "trigger_rule" not in existing_tables:
-                        logger.info(
-                            "Trigger rule table not found, creating...")
-                        self._create_trigger_rule_table(conn)
-                        tables_created.append("trigger_rule")
-
-                    if "trigger_rule_log" not in existing_tables:
-                        logger.info(
-                            "Trigger rule log table not found, creating...")
-                        self._create_trigger_rule_log_table(conn)
-                        tables_created.append("trigger_rule_log")
-
-                    if "model_vendor" not in existing_tables:
-                        logger.info(
-                            "Model vendor table not found, creating...")
-                        self._create_model_vendor_table(conn)
-                        tables_created.append("model_vendor")
-
-                    if "chat_history" not in existing_tables:
-                        logger.info(
-                            "Chat history table not found, creating...")
-                        self._create_chat_history_table(conn)
-                        tables_created.append("chat_history")
-
-                    if "mcp_config" not in existing_tables:
-                        logger.info("MCP config table not found, creating...")
-                        self._create_mcp_config_table(conn)
-                        tables_created.append("mcp_config")
-
-                    # If new tables were created, commit transaction
-                    if tables_created:
-                        conn.commit()
-                        logger.info(
-                            "Created missing tables: %s", tables_created)
-                    else:
-                        logger.info("All required tables already exist")
-
-                    logger.info(
-                        "Database loaded successfully: %s", self.db_path)
             else:
                 logger.info(
                     "Database file does not exist, creating new database: %s",
                     self.db_path
                 )
-                # Create database connection and initialize table structure
-                with self.get_connection() as conn:
-                    self._create_tables(conn)
-                    logger.info(
-                        "Database initialized successfully: %s", self.db_path)
+
+            # Every table and index is created with IF NOT EXISTS, so missing
+            # ones are added to existing databases without probing sqlite_master
+            with self.get_connection() as conn:
+                self._create_tables(conn)
+                logger.info(
+                    "Database initialized successfully: %s", self.db_path)
 
         except Exception as e:
             logger.error("Database initialization failed: %s", e)
             raise
 
     def _create_tables(self, conn: sqlite3.Connection) -> None:
-        """Create database table structure"""
-        self._create_kv_table(conn)
-        self._create_trigger_rule_table(conn)
-        self._create_trigger_rule_log_table(conn)
-        self._create_model_vendor_table(conn)
-        self._create_mcp_config_table(conn)
-        self._create_chat_history_table(conn)
+        """Create database table structure and indexes in one script"""
+        conn.executescript(SCHEMA_SQL)
         conn.commit()
         logger.info("Database table structure created successfully")
 
-    def _create_kv_table(self, conn: sqlite3.Connection) -> None:
-        """Create key-value table"""
-        cursor = conn.cursor()
-
-        # Create key-value table for storing general key-value data
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS kv (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                key TEXT UNIQUE NOT NULL,
-                value TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create index to improve query performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_kv_key ON kv(key)")
-        logger.info("KV table created successfully")
-
-    def _create_trigger_rule_table(self, conn: sqlite3.Connection) -> None:
-        """Create trigger rule table"""
-        cursor = conn.cursor()
-
-        # Create trigger rule table for storing trigger rules
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS trigger_rule (
-                id TEXT PRIMARY KEY,  -- Use UUID as primary key, no longer auto-increment
-                name TEXT NOT NULL,
-                enabled BOOLEAN DEFAULT 1,
-                camera_dids TEXT NOT NULL,  -- JSON format storage for camera device ID list
-                condition TEXT NOT NULL,    -- Trigger condition
-                execute_info TEXT,          -- JSON format storage for ExecuteInfo object
-                filter TEXT,                 -- JSON format storage for TriggerFilter object
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create indexes for trigger rule table to improve query performance
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_trigger_rule_name ON trigger_rule(name)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_trigger_rule_enabled ON trigger_rule(enabled)"
-        )
-
-        logger.info("Trigger rule table created successfully")
-
-    def _create_model_vendor_table(self, conn: sqlite3.Connection) -> None:
-        """Create model vendor table"""
-        cursor = conn.cursor()
-
-        # Create model vendor table for storing model access point information
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS model_vendor (
-                id TEXT PRIMARY KEY,  -- Use UUID as primary key
-                base_url TEXT NOT NULL,
-                api_key TEXT NOT NULL,
-                model_name TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create indexes for model vendor table to improve query performance
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_model_vendor_model_name ON model_vendor(model_name)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_model_vendor_base_url ON model_vendor(base_url)"
-        )
-        logger.info("Model vendor table created successfully")
-
-    def _create_mcp_config_table(self, conn: sqlite3.Connection) -> None:
-        """Create MCP config table"""
-        cursor = conn.cursor()
-
-        # Create MCP config table for storing MCP service configuration information
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mcp_config (
-                id TEXT PRIMARY KEY,  -- Use UUID as primary key
-                access_type TEXT NOT NULL,  -- Access type: http_sse, streamable_http, stdio
-                name TEXT NOT NULL,  -- Service name
-                description TEXT DEFAULT '',  -- Service description
-                provider TEXT DEFAULT '',  -- Provider
-                provider_website TEXT DEFAULT '',  -- Provider website
-                timeout INTEGER DEFAULT 60,  -- Timeout setting (seconds)
-                enable BOOLEAN DEFAULT 1,  -- Enable status: 1=enabled, 0=disabled
-                url TEXT,  -- Service URL (used by HTTP/SSE and Streamable HTTP)
-                request_header_token TEXT,  -- Request header Token (used by HTTP/SSE and Streamable HTTP)
-                command TEXT,  -- Command (used by Stdio)
-                args TEXT,  -- Parameter list JSON format (used by Stdio)
-                env_vars TEXT,  -- Environment variables JSON format (used by Stdio)
-                working_directory TEXT,  -- Working directory (used by Stdio)
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create indexes for MCP config table to improve query performance
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_mcp_config_name ON mcp_config(name)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_mcp_config_access_type ON mcp_config(access_type)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_mcp_config_provider ON mcp_config(provider)"
-        )
-        logger.info("MCP config table created successfully")
-
-    def _create_chat_history_table(self, conn: sqlite3.Connection) -> None:
-        """Create chat history table"""
-        cursor = conn.cursor()
-
-        # Create chat history table for storing conversation history
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chat_history (
-                session_id TEXT PRIMARY KEY,  -- Use UUID as primary key
-                title TEXT NOT NULL,  -- Conversation title
-                timestamp INTEGER NOT NULL,  -- Timestamp
-                messages TEXT,  -- JSON format storage for message content
-                session TEXT,  -- JSON format storage for session content
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create indexes for chat history table to improve query performance
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_chat_history_title ON chat_history(title)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_chat_history_created_at ON chat_history(created_at)"
-        )
-        logger.info("Chat history table created successfully")
-
-    def _create_trigger_rule_log_table(self, conn: sqlite3.Connection) -> None:
-        """Create trigger rule log table"""
-        cursor = conn.cursor()
-
-        # Create trigger rule log table for storing trigger rule execution logs
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS trigger_rule_log (
-                id TEXT PRIMARY KEY,  -- Use UUID as primary key
-                timestamp INTEGER NOT NULL,  -- Trigger time (millisecond Unix timestamp)
-                trigger_rule_id TEXT NOT NULL,  -- Trigger rule ID
-                trigger_rule_name TEXT NOT NULL,  -- Trigger rule name
-                trigger_rule_condition TEXT NOT NULL,  -- Trigger rule condition
-                camera_condition_results TEXT NOT NULL,  -- JSON format storage for camera trigger condition result list
-                execute_result TEXT,  -- JSON format storage for ExecuteResult object
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create indexes for trigger rule log table to improve query performance
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_trigger_rule_log_timestamp ON trigger_rule_log(timestamp)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_trigger_rule_log_rule_id ON trigger_rule_log(trigger_rule_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_trigger_rule_log_created_at ON trigger_rule_log(created_at)"
-        )
-        logger.info("Trigger rule log table created successfully")
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection and apply per-connection settings once"""
+        conn = sqlite3.connect(str(self.db_path),
+                               timeout=self.timeout,
+                               check_same_thread=self.check_same_thread,
+                               isolation_level=self.isolation_level,
+                               # DAO queries are fixed SQL strings, keep them all compiled
+                               cached_statements=512)
+        # Set row factory to return dictionary format results
+        conn.row_factory = sqlite3.Row
+        # Enable foreign key constraints
+        conn.execute("PRAGMA foreign_keys = ON")
+        # WAL keeps readers off the writer, NORMAL sync is safe with WAL
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -64000")
+        return conn
 
     @contextmanager
     def get_connection(self):
-        """Get database connection context manager"""
-        conn = None
-        try:
-            conn = sqlite3.connect(str(self.db_path),
-                                   timeout=self.timeout,
-                                   check_same_thread=self.check_same_thread,
-                                   isolation_level=self.isolation_level)
-            # Set row factory to return dictionary format results
-            conn.row_factory = sqlite3.Row
-            # Enable foreign key constraints
-            conn.execute("PRAGMA foreign_keys = ON")
+        """Get database connection context manager, yields the shared connection"""
+        with self._lock:
+            try:
+                if self._connection is None:
+                    self._connection = self._connect()
+                yield self._connection
+            except Exception as e:
+                if self._connection is not None and self._connection.in_transaction:
+                    self._connection.rollback()
+                logger.error("Database connection error: %s", e)
+                raise
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements in one explicit write transaction
+
+        The connection is in autocommit mode by default, where every statement
+        commits (and syncs) on its own. Nested use joins the open transaction.
+        Do not await inside, the connection is shared with the event loop.
+        """
+        with self.get_connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
             yield conn
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error("Database connection error: %s", e)
-            raise
-        finally:
-            if conn:
-                conn.close()
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the shared connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
     def execute_query(self,
                       query: str,
@@ -332,6 +225,30 @@ class SQLiteConnector:
             logger.error("Query execution failed: %s, SQL: %s", e, query)
             raise
 
+    def execute_query_iter(self,
+                           query: str,
+                           params: Optional[Tuple] = None,
+                           chunk_size: int = 1000) -> Iterator[sqlite3.Row]:
+        """Execute query statement and yield rows in fetched chunks
+
+        Rows are sqlite3.Row objects (indexable by column name), no dict copies
+        are made. The connection is held until the iterator is exhausted or
+        closed, so consume it fully without awaiting in between.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params or ())
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield from rows
+
+        except Exception as e:
+            logger.error("Query execution failed: %s, SQL: %s", e, query)
+            raise
+
     def execute_update(self,
                        query: str,
                        params: Optional[Tuple] = None) -> int:
@@ -353,16 +270,37 @@ class SQLiteConnector:
     def execute_many(self, query: str, params_list: List[Tuple]) -> int:
         """Batch execute statements"""
         try:
-            with self.get_connection() as conn:
+            with self.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.executemany(query, params_list)
-                conn.commit()
                 return cursor.rowcount
 
         except Exception as e:
             logger.error("Batch execution failed: %s, SQL: %s", e, query)
             raise
 
+    def execute_in_chunks(self, query_template: str, values: List[Any],
+                          chunk_size: int = 500) -> int:
+        """Execute statement with an IN list in chunks within one transaction
+
+        query_template must contain a {placeholders} field, which is filled with
+        one "?" per value, chunks stay below SQLite's bound parameter limit.
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                affected_rows = 0
+                for start in range(0, len(values), chunk_size):
+                    chunk = values[start:start + chunk_size]
+                    query = query_template.format(placeholders=",".join("?" * len(chunk)))
+                    cursor.execute(query, chunk)
+                    affected_rows += cursor.rowcount
+                return affected_rows
+
+        except Exception as e:
+            logger.error("Chunked execution failed: %s, SQL: %s", e, query_template)
+            raise
+
     def get_database_info(self) -> Dict[str, Any]:
         """Get database information"""
         try:
@@ -404,6 +342,12 @@ def init_database() -> None:
     get_db_connector().initialize_database()
 
 
+def close_database() -> None:
+    """Convenience function to close database connection"""
+    if db_connector is not None:
+        db_connector.close()
+
+
 def get_db_connector() -> SQLiteConnector:
     """Get database connector instance"""
     global db_connector
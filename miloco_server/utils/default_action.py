@@ -6,7 +6,10 @@ Default action manager for preset actions.
 Provides default actions including Mi Home scene list and Home Assistant automation list.
 """
 
+import asyncio
 import logging
+import time
+from typing import Awaitable, Callable
 
 from miloco_server.schema.trigger_schema import Action
 from miloco_server.mcp.tool_executor import ToolExecutor
@@ -23,73 +26,100 @@ class DefaultPresetActionManager:
     2. Get Home Assistant automation list
     """
 
+    # Scene / automation lists rarely change, cache them briefly
+    _CACHE_TTL = 30
+
     def __init__(self, tool_executor: ToolExecutor):
         self._tool_executor = tool_executor
         self._mcp_client_manager = tool_executor.mcp_client_manager
+        self._cache: dict[str, tuple[float, asyncio.Task]] = {}
+
+    async def _get_cached(
+            self, key: str,
+            fetch: Callable[[], Awaitable[dict[str, Action]]]) -> dict[str, Action]:
+        """
+        Return the cached result of fetch, sharing one in-flight call
+        between concurrent callers. Failed or empty results are not kept.
+        """
+        entry = self._cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            task = asyncio.create_task(fetch())
+            entry = (time.monotonic() + self._CACHE_TTL, task)
+            self._cache[key] = entry
+        task = entry[1]
+        try:
+            result = await asyncio.shield(task)
+        except Exception:
+            if self._cache.get(key) is entry:
+                del self._cache[key]
+            raise
+        if not result and self._cache.get(key) is entry:
+            del self._cache[key]
+        return dict(result)
 
     async def get_miot_scene_actions(self) -> dict[str, Action]:
+        return await self._get_cached("miot_scene", self._fetch_miot_scene_actions)
+
+    async def get_ha_automation_actions(self) -> dict[str, Action]:
+        return await self._get_cached("ha_automation", self._fetch_ha_automation_actions)
+
+    async def _fetch_miot_scene_actions(self) -> dict[str, Action]:
         # Dynamically get miot client
         miot_client = self._mcp_client_manager.get_client("miot_manual_scenes")
         if miot_client is None:
             logger.error("Mi Home client not initialized or connection failed")
             return {}
-        tool = miot_client.get_tool("trigger_manual_scene")
-        if tool is None:
+        # Returned actions target this tool, make sure it is exposed
+        if miot_client.get_tool("trigger_manual_scene") is None:
             logger.error("Mi Home scene tool not found")
             return {}
         result = await miot_client.call_tool("get_manual_scenes", {})
         logger.info("get_miot_scene_actions: %s", result)
         scenes = result.get("result", [])
 
-        actions_dict = {}
-        for scene in scenes:
-            scene_name = scene["scene_name"]
-            scene_id = scene["scene_id"]
-
-            action = Action(
+        server_name = miot_client.config.server_name
+        actions_dict = {
+            scene["scene_id"]: Action(
                 mcp_client_id="miot_manual_scenes",
                 mcp_tool_name="trigger_manual_scene",
-                mcp_tool_input={"scene_id": scene_id},
-                mcp_server_name=miot_client.config.server_name,
-                introduction=f"{scene_name}",
+                mcp_tool_input={"scene_id": scene["scene_id"]},
+                mcp_server_name=server_name,
+                introduction=f"{scene['scene_name']}",
             )
-            actions_dict[scene_id] = action
-
-        logger.info("get_miot_scene_actions: %s", actions_dict)
+            for scene in scenes
+        }
+        logger.debug("get_miot_scene_actions: %d actions", len(actions_dict))
 
         return actions_dict
 
-    async def get_ha_automation_actions(self) -> dict[str, Action]:
+    async def _fetch_ha_automation_actions(self) -> dict[str, Action]:
         # Dynamically get ha client
         ha_client = self._mcp_client_manager.get_client("ha_automations")
         if ha_client is None:
             logger.error("Home Assistant client not initialized or connection failed")
             return {}
 
-        tool = ha_client.get_tool("trigger_automation")
-        if tool is None:
+        # Returned actions target this tool, make sure it is exposed
+        if ha_client.get_tool("trigger_automation") is None:
             logger.error("Home Assistant automation tool not found")
             return {}
         result = await ha_client.call_tool("get_automations", {})
         logger.info("get_ha_automation_actions: %s", result)
 
-        actions_dict = {}
         # Fix: correctly extract automations list from result
         automations = result.get("result", [])
-        for automation in automations:
-            automation_scene_id = automation.get("automation_id")
-            automation_name = automation.get("automation_name")
-
-            action = Action(
+        server_name = ha_client.config.server_name
+        actions_dict = {
+            automation.get("automation_id"): Action(
                 mcp_client_id="ha_automations",
                 mcp_tool_name="trigger_automation",
-                mcp_tool_input={"automation_id": automation_scene_id},
-                mcp_server_name=ha_client.config.server_name,
-                introduction=f"{automation_name}",
+                mcp_tool_input={"automation_id": automation.get("automation_id")},
+                mcp_server_name=server_name,
+                introduction=f"{automation.get('automation_name')}",
             )
-            actions_dict[automation_scene_id] = action
-
-        logger.info("get_ha_automation_actions: %s", actions_dict)
+            for automation in automations
+        }
+        logger.debug("get_ha_automation_actions: %d actions", len(actions_dict))
 
         return actions_dict
 
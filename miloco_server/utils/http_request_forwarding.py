@@ -12,6 +12,29 @@ from miloco_server.middleware.exceptions import ExternalServiceException
 
 logger = logging.getLogger(__name__)
 
+# Reused across forwarded requests so connections stay alive between calls
+_forwarding_client: Optional[httpx.AsyncClient] = None
+
+
+def get_forwarding_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by forwarded requests, create it on first use"""
+    global _forwarding_client  # pylint: disable=global-statement
+    if _forwarding_client is None or _forwarding_client.is_closed:
+        _forwarding_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100,
+                                keepalive_expiry=30.0),
+        )
+    return _forwarding_client
+
+
+async def close_forwarding_client():
+    """Close the HTTP client shared by forwarded requests"""
+    global _forwarding_client  # pylint: disable=global-statement
+    if _forwarding_client is not None:
+        await _forwarding_client.aclose()
+        _forwarding_client = None
+
 
 async def forward_request(
     method: str,
@@ -36,25 +59,74 @@ async def forward_request(
         httpx.Response: HTTP response object
         include error http code used by response.raise_for_status()
     Raises:
-        httpx.HTTPError: Raised when request fails
+        ExternalServiceException: Raised when the request cannot be sent or no response arrives
+    """
+    client = get_forwarding_client()
+    logger.info("Forwarding %s request to %s", method, target_url)
+    try:
+        response = await client.request(
+            method=method.upper(),
+            url=target_url,
+            headers=headers,
+            params=params,
+            json=json_data,
+            timeout=timeout
+        )
+        logger.debug("Forwarding Service Request forwarded successfully: %s %s - Status: %d",
+                   method, target_url, response.status_code)
+        return response # include error http code used by response.raise_for_status()
+    except (httpx.HTTPError, httpx.InvalidURL) as e:
+        logger.error("Forwarding Service Request faild: %s - %s", target_url, str(e))
+        raise ExternalServiceException(
+            f"Forwarding Service faild: {target_url} - {str(e)}") from e
+
+async def forward_request_stream(
+    method: str,
+    target_url: str,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+    timeout: float = 30.0
+) -> httpx.Response:
     """
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        logger.info("Forwarding %s request to %s", method, target_url)
-        try:
-            response = await client.request(
-                method=method.upper(),
-                url=target_url,
-                headers=headers,
-                params=params,
-                json=json_data
-            )
-            logger.info("Forwarding Service Request forwarded successfully: %s %s - Status: %d",
-                       method, target_url, response.status_code)
-            return response # include error http code used by response.raise_for_status()
-        except Exception as e:
-            logger.error("Forwarding Service Request faild: %s - %s", target_url, str(e))
-            raise ExternalServiceException(
-                f"Forwarding Service faild: {target_url} - {str(e)}") from e
+    Forward HTTP request to target URL without reading the response body
+
+    The returned response has only its status and headers loaded; the body is
+    read on demand, e.g. piped through
+    StreamingResponse(response.aiter_raw(), background=BackgroundTask(response.aclose)).
+    The caller must close the response once done.
+
+    Args:
+        method: HTTP method (GET, POST, PUT, DELETE, etc.)
+        target_url: Target URL
+        headers: Request headers
+        params: URL query parameters
+        json_data: JSON request body
+        timeout: Request timeout in seconds
+
+    Returns:
+        httpx.Response: Streaming HTTP response object
+    """
+    client = get_forwarding_client()
+    logger.info("Forwarding %s request to %s (stream)", method, target_url)
+    try:
+        request = client.build_request(
+            method=method.upper(),
+            url=target_url,
+            headers=headers,
+            params=params,
+            json=json_data,
+            timeout=timeout
+        )
+        response = await client.send(request, stream=True)
+        logger.debug("Forwarding Service Request forwarded successfully: %s %s - Status: %d",
+                   method, target_url, response.status_code)
+        return response
+    except (httpx.HTTPError, httpx.InvalidURL) as e:
+        logger.error("Forwarding Service Request faild: %s - %s", target_url, str(e))
+        raise ExternalServiceException(
+            f"Forwarding Service faild: {target_url} - {str(e)}") from e
+
 
 async def forward_get(
     target_url: str,
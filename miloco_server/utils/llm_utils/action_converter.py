@@ -3,45 +3,18 @@
 
 import json
 import logging
+import textwrap
 from typing import Optional
 
-from miloco_server.utils.normal_util import extract_json_from_content
+from miloco_server.utils.normal_util import load_json_from_content
 
 from miloco_server.utils.llm_utils.base_llm_util import BaseLLMUtil
 from miloco_server.schema.trigger_schema import Action
 
 logger = logging.getLogger(__name__)
 
-
-class ConverterResult:
-    """Result of action converter"""
-    action_description: str
-    is_inside: bool
-    automation_id: Optional[str]
-    action: Optional[Action]
-
-    def __init__(self, action_description: str, is_inside: bool, automation_id: Optional[str], action: Optional[Action]):
-        self.action_description = action_description
-        self.is_inside = is_inside
-        self.automation_id = automation_id
-        self.action = action
-
-class ActionDescriptionConverter(BaseLLMUtil):
-    """Used to convert natural language of actions to Action structure language"""
-
-    def __init__(
-        self,
-        request_id: str,
-        action_descriptions: list[str],
-        preset_actions: dict[str, Action],
-    ):
-        super().__init__(request_id = request_id, query = None, tools_meta = None)
-        self._action_descriptions = action_descriptions
-        self._preset_actions = preset_actions
-
-    def _get_system_prompt(self) -> str:
-        """Get system prompt"""
-        return """
+# Constant prompt prefix, kept byte-identical across calls, indentation is not sent
+_SYSTEM_PROMPT = textwrap.dedent("""
         You are a scenario selection assistant for a user. 
         I will first provide you with a list of automation scenario IDs and names for all users, 
         then a list of scenario names the user wants to select. 
@@ -74,49 +47,130 @@ class ActionDescriptionConverter(BaseLLMUtil):
                 }
             ]
         }
-        """
+        """).strip()
+
+
+class ConverterResult:
+    """Result of action converter"""
+    __slots__ = ("action_description", "is_inside", "automation_id", "action")
+
+    action_description: str
+    is_inside: bool
+    automation_id: Optional[str]
+    action: Optional[Action]
+
+    def __init__(self, action_description: str, is_inside: bool, automation_id: Optional[str], action: Optional[Action]):
+        self.action_description = action_description
+        self.is_inside = is_inside
+        self.automation_id = automation_id
+        self.action = action
+
+class ActionDescriptionConverter(BaseLLMUtil):
+    """Used to convert natural language of actions to Action structure language"""
+    _use_response_cache = True
+
+    def __init__(
+        self,
+        request_id: str,
+        action_descriptions: list[str],
+        preset_actions: dict[str, Action],
+    ):
+        super().__init__(request_id = request_id, query = None, tools_meta = None)
+        self._action_descriptions = action_descriptions
+        self._preset_actions = preset_actions
+        # Descriptions left for the LLM after exact matching
+        self._llm_action_descriptions = action_descriptions
+
+    def _get_system_prompt(self) -> str:
+        """Get system prompt"""
+        return _SYSTEM_PROMPT
+
     def _init_conversation(self) -> None:
         """Initialize conversation history"""
         self._chat_history.add_content("system", self._get_system_prompt())
 
-        all_preset_actions = {}
-        for automation_id, action in self._preset_actions.items():
-            all_preset_actions[automation_id] = action.introduction
-
-        self._chat_history.add_content("user", f"All automation IDs and names: {json.dumps(all_preset_actions)}")
-        self._chat_history.add_content("user", f"User wants to select: {json.dumps(self._action_descriptions)}")
+        all_preset_actions = {
+            automation_id: action.introduction
+            for automation_id, action in self._preset_actions.items()
+        }
+        # Sorted so the same preset actions always render the same prompt
+        self._chat_history.add_content(
+            "user", f"All automation IDs and names: {json.dumps(all_preset_actions, sort_keys=True)}")
+        self._chat_history.add_content(
+            "user", f"User wants to select: {json.dumps(self._llm_action_descriptions)}")
 
     async def run(self) -> list[ConverterResult]:
-        try:
-            if not self._preset_actions:
-                return self._make_no_matched_converter_results()
-
-            self._init_conversation()
-            content, _, _ = await self._call_llm()
-            json_content = extract_json_from_content(content)
-            result = json.loads(json_content)
-            if not result:
-                raise ValueError(f"No JSON in LLM response: {content}")
-            # Extract results array from the response object
-            results_list = result.get("results", result if isinstance(result, list) else [])
-            if not results_list:
-                raise ValueError(f"No results in LLM response: {content}")
-            return [ConverterResult(
-                action_description=item["action_description"],
-                is_inside=item["is_inside"],
-                automation_id=item.get("automation_id"),
-                action=self._preset_actions.get(item.get("automation_id"))
-            ) for item in results_list]
+        if not self._preset_actions:
+            return self._make_no_matched_converter_results(self._action_descriptions)
+
+        exact_results = self._match_exact()
+        self._llm_action_descriptions = [
+            action_description
+            for action_description, exact_result in zip(self._action_descriptions, exact_results)
+            if exact_result is None
+        ]
+        if not self._llm_action_descriptions:
+            return exact_results
 
+        try:
+            llm_results = await self._convert_by_llm()
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("[%s] Error occurred during agent execution: %s", self._request_id, str(e))
-            return self._make_no_matched_converter_results()
+            llm_results = self._make_no_matched_converter_results(self._llm_action_descriptions)
 
-    def _make_no_matched_converter_results(self) -> list[ConverterResult]:
+        if len(llm_results) != len(self._llm_action_descriptions):
+            # Can not line up with the descriptions, callers match by action_description
+            return [result for result in exact_results if result is not None] + llm_results
+        llm_iter = iter(llm_results)
+        return [result if result is not None else next(llm_iter) for result in exact_results]
+
+    def _match_exact(self) -> list[Optional[ConverterResult]]:
+        """Match descriptions equal to exactly one preset introduction, None for the rest"""
+        introduction_to_id: dict[str, Optional[str]] = {}
+        for automation_id, action in self._preset_actions.items():
+            if not action.introduction:
+                continue
+            introduction = action.introduction.strip().casefold()
+            # Ambiguous introductions are left to the LLM
+            introduction_to_id[introduction] = (
+                None if introduction in introduction_to_id else automation_id)
+
+        results = []
+        for action_description in self._action_descriptions:
+            automation_id = introduction_to_id.get(action_description.strip().casefold())
+            results.append(ConverterResult(
+                action_description=action_description,
+                is_inside=True,
+                automation_id=automation_id,
+                action=self._preset_actions[automation_id]
+            ) if automation_id is not None else None)
+        return results
+
+    async def _convert_by_llm(self) -> list[ConverterResult]:
+        """Convert the remaining descriptions with the LLM"""
+        self._init_conversation()
+        content = await self._call_llm_json()
+        result = load_json_from_content(content)
+        if not result:
+            raise ValueError(f"No JSON in LLM response: {content}")
+        # Extract results array from the response object
+        results_list = result.get("results", result if isinstance(result, list) else [])
+        if not results_list:
+            raise ValueError(f"No results in LLM response: {content}")
+        get_preset_action = self._preset_actions.get
+        results = []
+        for item in results_list:
+            automation_id = item.get("automation_id")
+            results.append(ConverterResult(
+                item["action_description"], item["is_inside"],
+                automation_id, get_preset_action(automation_id)))
+        return results
+
+    def _make_no_matched_converter_results(self, action_descriptions: list[str]) -> list[ConverterResult]:
         """Make no matched converter results"""
         return [ConverterResult(
             action_description=action_description,
             is_inside=False,
             automation_id=None,
             action=None
-        ) for action_description in self._action_descriptions]
\ No newline at end of file
+        ) for action_description in action_descriptions]
@@ -1,20 +1,62 @@
 # Copyright (C) 2025 Xiaomi Corporation
 # This software may be used and distributed according to the terms of the Xiaomi Miloco License Agreement.
 
+import hashlib
 import json
 import logging
 from typing import Any, List, Optional
 
+from cachetools import TTLCache
 from miloco_server.schema.chat_history_schema import ChatHistoryMessages
 from miloco_server.utils.local_models import ModelPurpose
+from miloco_server.utils.normal_util import load_json_from_content
 from openai.types.chat import ChatCompletion, ChatCompletionToolParam
 from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMessageToolCall
 
 logger = logging.getLogger(__name__)
 
+# Final answers (no tool calls) keyed by model and prompt, calls run at temperature 0
+# so an identical prompt gets the same answer: (content, finish_reason)
+# Only utils with _use_response_cache set read and fill it
+_llm_response_cache: TTLCache[str, tuple[str, str]] = TTLCache(maxsize=1024, ttl=600)
+
+
+class _JsonObjectScanner:
+    """Track brace depth of streamed text, report when a top-level object closes"""
+    __slots__ = ("_depth", "_in_string", "_escape")
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> bool:
+        """Feed next text chunk, return True if a top-level object closed in it"""
+        closed = False
+        for char in text:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                # Quotes in text around the object are not strings
+                self._in_string = self._depth > 0
+            elif char == "{":
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                closed = closed or self._depth == 0
+        return closed
+
 
 class BaseLLMUtil:
     """Used to convert natural language of actions to Action structure language"""
+    # Reuse answers of identical text prompts, off by default since image
+    # prompts are large to hash and their answers go stale
+    _use_response_cache: bool = False
 
     def __init__(
         self,
@@ -26,7 +68,8 @@ class BaseLLMUtil:
         self._manager = get_manager()
 
         self._request_id = request_id
-        self._llm_proxy = self._manager.get_llm_proxy_by_purpose(ModelPurpose.PLANNING) # use PLANNING as default
+        self._model_purpose = ModelPurpose.PLANNING # use PLANNING as default
+        self._llm_proxy = self._manager.get_llm_proxy_by_purpose(self._model_purpose)
         self._tool_executor = self._manager.tool_executor
         self._chat_history = ChatHistoryMessages()
         self._query = query
@@ -53,6 +96,14 @@ class BaseLLMUtil:
                 raise RuntimeError(
                     "LLM proxy not exit, Please configure on the Model Settings Page.")
             chat_messages = self._chat_history.get_messages()
+            cache_key = self._response_cache_key(chat_messages)
+            cached = _llm_response_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                content, finish_reason = cached
+                logger.info("[%s] LLM response cache hit", self._request_id)
+                self._chat_history.add_assistant_message(content)
+                return content, None, finish_reason
+
             llm_result = await self._llm_proxy.async_call_llm(
                 chat_messages, self._tools_meta)
 
@@ -80,6 +131,10 @@ class BaseLLMUtil:
             content = message.content
             tool_calls = message.tool_calls
 
+            # Tool calls have side effects, only plain answers are reused
+            if cache_key and not tool_calls and content is not None:
+                _llm_response_cache[cache_key] = (content, finish_reason)
+
             return content, tool_calls, finish_reason
 
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -88,6 +143,75 @@ class BaseLLMUtil:
             raise e
 
 
+    async def _call_llm_json(self) -> str:
+        """
+        Call large language model for a JSON object answer (no tools)
+        The response is streamed and the stream is closed as soon as the first
+        top-level object decodes, text after it is never generated
+        """
+        try:
+            if not self._llm_proxy:
+                raise RuntimeError(
+                    "LLM proxy not exit, Please configure on the Model Settings Page.")
+            chat_messages = self._chat_history.get_messages()
+            cache_key = self._response_cache_key(chat_messages)
+            cached = _llm_response_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                content, _ = cached
+                logger.info("[%s] LLM response cache hit", self._request_id)
+                self._chat_history.add_assistant_message(content)
+                return content
+
+            parts: list[str] = []
+            scanner = _JsonObjectScanner()
+            stream = self._llm_proxy.async_call_llm_stream(chat_messages)
+            try:
+                async for llm_result in stream:
+                    if not llm_result.get("success", False):
+                        error = llm_result.get("error", "Unknown error")
+                        raise RuntimeError(f"LLM call failed: {error}")
+                    choices = llm_result["chunk"].choices
+                    delta = choices[0].delta.content if choices else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    if scanner.feed(delta) and self._decodes("".join(parts)):
+                        break
+            finally:
+                await stream.aclose()
+
+            content = "".join(parts)
+            logger.info("[%s] LLM response: %s", self._request_id, content)
+            self._chat_history.add_assistant_message(content)
+            if cache_key and content:
+                _llm_response_cache[cache_key] = (content, "stop")
+            return content
+
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("[%s] Error occurred while calling LLM: %s",
+                         self._request_id, str(e))
+            raise e
+
+    @staticmethod
+    def _decodes(content: str) -> bool:
+        """Check if content already holds a complete JSON object"""
+        try:
+            return isinstance(load_json_from_content(content), dict)
+        except ValueError:
+            return False
+
+
+    def _response_cache_key(self, chat_messages: list) -> Optional[str]:
+        """Hash of everything that determines the LLM answer, None if caching is off"""
+        if not self._use_response_cache:
+            return None
+        payload = json.dumps(
+            [self._model_purpose.value, self._llm_proxy.model_name,
+             getattr(self._llm_proxy, "base_url", None), self._tools_meta, chat_messages],
+            sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
     def _has_tool_calls(self, tool_calls: List[ChatCompletionMessageToolCall]) -> bool:
         """Check if there are tool calls"""
         return bool(tool_calls)
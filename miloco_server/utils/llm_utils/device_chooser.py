@@ -8,19 +8,31 @@ Currently supports camera selection with location-based filtering.
 
 import json
 import logging
+import textwrap
 from typing import List, Optional
 
 from miloco_server.utils.llm_utils.base_llm_util import BaseLLMUtil
 
 from miloco_server.schema.miot_schema import CameraInfo
-from miloco_server.utils.normal_util import extract_json_from_content
+from miloco_server.utils.normal_util import load_json_from_content
 
 
 logger = logging.getLogger(__name__)
 
+# Constant prompt prefix, kept byte-identical across calls, indentation is not sent
+_SYSTEM_PROMPT = textwrap.dedent("""
+        Device selector, select devices based on location.
+        Next I will give you a set of device information and the location the user wants. You need to select devices based on location information and return the device did.
+        You can only return in JSON format, JSON format is:
+        {
+            "device_ids": ["did1", "did2", "did3"]
+        }
+        """).strip()
+
 
 class DeviceChooser(BaseLLMUtil):
     """For device selection, currently only supports camera selection, singleton implementation"""
+    _use_response_cache = True
 
     def __init__(self,
                  request_id: str,
@@ -28,20 +40,14 @@ class DeviceChooser(BaseLLMUtil):
                  choose_camera_device_ids: Optional[List[str]] = None):
         super().__init__(request_id=request_id, tools_meta=None)
         self._location = location
-        self._choose_camera_device_ids = choose_camera_device_ids
+        self._choose_camera_device_ids = (
+            frozenset(choose_camera_device_ids) if choose_camera_device_ids else None)
         self._choosed_cameras = []
         self._all_cameras = []
 
     def _get_system_prompt(self) -> str:
         """Get system prompt"""
-        return """
-        Device selector, select devices based on location.
-        Next I will give you a set of device information and the location the user wants. You need to select devices based on location information and return the device did.
-        You can only return in JSON format, JSON format is:
-        {
-            "device_ids": ["did1", "did2", "did3"]
-        }
-        """
+        return _SYSTEM_PROMPT
 
     def _init_conversation(self) -> None:
         self._chat_history.add_content("system", self._get_system_prompt())
@@ -70,20 +76,21 @@ class DeviceChooser(BaseLLMUtil):
                 return self._all_cameras, self._all_cameras
 
             self._init_conversation()
-            content, _, _ = await self._call_llm()
+            content = await self._call_llm_json()
 
             if not content:
                 return [], self._all_cameras
 
-            json_content = extract_json_from_content(content)
-            if not json_content:
+            result = load_json_from_content(content)
+            if not result:
                 raise ValueError(f"No JSON in LLM response: {content}")
 
-            device_ids = json.loads(json_content).get("device_ids", [])
+            device_ids = result.get("device_ids", [])
             if not device_ids:
                 raise ValueError(
-                    f"No device_ids in LLM response: {json_content}")
+                    f"No device_ids in LLM response: {content}")
 
+            device_ids = set(device_ids)
             return [c for c in self._all_cameras if c.did in device_ids], self._all_cameras
         except Exception as e: # pylint: disable=broad-exception-caught
             logger.error("[%s] Error occurred during device chooser: %s",
@@ -26,7 +26,8 @@ class VisionUnderstander(BaseLLMUtil):
     ):
         """Initialize VisionUnderstander"""
         super().__init__(request_id=request_id, query=query, tools_meta=None)
-        self._llm_proxy = self._manager.get_llm_proxy_by_purpose(ModelPurpose.VISION_UNDERSTANDING)
+        self._model_purpose = ModelPurpose.VISION_UNDERSTANDING
+        self._llm_proxy = self._manager.get_llm_proxy_by_purpose(self._model_purpose)
         self._camera_img_seqs = camera_img_seqs
         self._language = language
         self._init_conversation()
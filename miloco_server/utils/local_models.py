@@ -8,6 +8,7 @@ Provides functionality to manage local AI models including loading, unloading, a
 
 import asyncio
 import logging
+import time
 from enum import Enum
 from typing import List
 
@@ -45,13 +46,14 @@ class LocalModelApi(str, Enum):
 class LocalModels:
     """Local model management class."""
 
+    # Model list is reused for this many seconds before asking ai_engine again
+    _REFRESH_TTL = 2.0
+
     def __init__(self):
         self._local_models: List[LLMModelInfo] = []
-        try:
-            asyncio.create_task(self._fetch_models_from_http_sync())
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error("Init local model list failed: %s", e)
-            raise LLMServiceException("Init local model list failed") from e
+        self._last_refresh = float("-inf")
+        # Fetched on first use, the stale timestamp makes the first caller refresh
+        self._refresh_task: Optional[asyncio.Task] = None
 
     async def toggle_model(self, model_name: str, load: bool):
         """Load or unload specified model."""
@@ -69,20 +71,30 @@ class LocalModels:
     async def get_local_models(self) -> List[LLMModelInfo]:
         """Get cached local model list."""
         try:
-            await self._fetch_models_from_http_sync()
+            await self._refresh_models()
         except Exception:  # pylint: disable=broad-exception-caught
             self._local_models = []
         return self._local_models
 
     async def get_local_model_from_id(self, model_id: str) -> LLMModelInfo:
         """Get local model by ID."""
-        await self.get_local_models()  # refresh local models
+        await self.get_local_models()  # refresh local models if stale
 
         for model in self._local_models:
             if model.id == model_id:
                 return model
         return None
 
+    async def _refresh_models(self):
+        """Refresh model list once it is older than the TTL, concurrent callers share one request."""
+        if time.monotonic() - self._last_refresh < self._REFRESH_TTL:
+            return
+        task = self._refresh_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._fetch_models_from_http_sync())
+            self._refresh_task = task
+        await asyncio.shield(task)
+
     def _get_service_url(self, api: LocalModelApi) -> str:
         """Get service URL"""
         host: str = LOCAL_MODEL_CONFIG["host"]
@@ -109,6 +121,7 @@ class LocalModels:
                 for idx, model in enumerate(data)
             ]
         self._local_models = models
+        self._last_refresh = time.monotonic()
 
     async def _forward_local_models_services(self,
                                              target_url: str,
@@ -136,14 +149,15 @@ class LocalModels:
             if not response.content:
                 logger.error("Empty response received from %s", target_url)
                 raise LLMServiceException("Received empty response from local model service")
-            # Check if response content is not JSON
-            if not response.is_json():
+            # Check if response content is not JSON, parsed once and reused below
+            try:
+                error_data = response.json()
+            except ValueError:
                 logger.error("Response content is not JSON from %s", target_url)
-                raise LLMServiceException("Received non-JSON response from local model service")
+                raise LLMServiceException("Received non-JSON response from local model service") from e
 
             # Handle HTTP errors
-            error_data = response.json()
-            if error_data and error_data.get("code", None) and error_data.get("message", None):
+            if isinstance(error_data, dict) and error_data.get("code", None) and error_data.get("message", None):
                 logger.error("Forward local model service failed: errCode[%s]: %s",
                             error_data["code"], error_data["message"])
                 raise LLMServiceException(error_data["message"]) from e
@@ -3,10 +3,13 @@
 
 """Media manager."""
 import asyncio
+import functools
 import hashlib
+import itertools
 import logging
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import List, Optional
 
 import aiofiles
@@ -19,20 +22,26 @@ class ImageManager:
     """Image manager."""
     _base_path: str
     _url_prefix: Optional[str]
-    _counter: int
-    _counter_lock: asyncio.Lock
+    _counter: itertools.count
+    _write_semaphore: asyncio.Semaphore
     _dt_prefix: str
+    _dt_prefix_expire: float
+    _name_prefix_cache: dict[tuple[str, int], str]
 
-    def __init__(self, base_path: str, url_prefix: Optional[str] = None):
+    def __init__(self, base_path: str, url_prefix: Optional[str] = None,
+                 max_concurrent_writes: int = 8):
         # Create base path if not exists
         os.makedirs(base_path, exist_ok=True)
         self._base_path = base_path
         self._url_prefix = url_prefix
-        self._counter = 0
-        self._counter_lock = asyncio.Lock()
-        # Create date path if not exists
-        self._dt_prefix = datetime.now().strftime('%y%m%d')
-        os.makedirs(os.path.join(base_path, self._dt_prefix), exist_ok=True)
+        self._counter = itertools.count(1)
+        # Shared by all callers (trigger rule logs, vision chat) to bound disk writes
+        self._write_semaphore = asyncio.Semaphore(max_concurrent_writes)
+        # (did, channel) -> "<date dir>/<hash>_", rebuilt when the day rolls over
+        self._name_prefix_cache = {}
+        # Date path is created on first save
+        self._dt_prefix = ''
+        self._dt_prefix_expire = 0.0
 
     @property
     def base_path(self) -> str:
@@ -46,86 +55,119 @@ class ImageManager:
 
     async def save_image_async(self, did: str, raw_img: bytes, channel: int = 0) -> str:
         """Save image."""
-        image_name = await self.__generate_name(did, channel)
+        image_name = self.__generate_name(did, channel)
         try:
-            async with aiofiles.open(os.path.join(self._base_path, image_name), 'wb') as f:
-                await f.write(raw_img)
+            async with self._write_semaphore:
+                async with aiofiles.open(os.path.join(self._base_path, image_name), 'wb') as f:
+                    await f.write(raw_img)
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOGGER.error('Save image error, %s: %s', image_name, err)
+        return self._image_url(image_name)
+
+    async def save_image_list_async(self, did: str, raw_img_list: List, channel: int = 0) -> List:
+        """Save image list, all files are written in one worker thread hop."""
+        image_name_list = [self.__generate_name(did, channel) for _ in raw_img_list]
+        async with self._write_semaphore:
+            await asyncio.to_thread(self._write_images, list(zip(image_name_list, raw_img_list)))
+        return [self._image_url(image_name) for image_name in image_name_list]
+
+    def _write_images(self, images: List[tuple[str, bytes]]) -> None:
+        """Write image files, blocking."""
+        for image_name, raw_img in images:
+            try:
+                with open(os.path.join(self._base_path, image_name), 'wb') as f:
+                    f.write(raw_img)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                _LOGGER.error('Save image error, %s: %s', image_name, err)
+
+    def _image_url(self, image_name: str) -> str:
         if not self._url_prefix:
             return image_name
         return os.path.join(self._url_prefix, image_name)
 
-    async def save_image_list_async(self, did: str, raw_img_list: List, channel: int = 0) -> List:
-        """Save image list."""
-        image_name_list = []
-        tasks = []
-        for raw_img in raw_img_list:
-            tasks.append(self.save_image_async(did, raw_img, channel))
-        image_name_list = await asyncio.gather(*tasks, return_exceptions=True)
-        return image_name_list
+    def get_image_path(self, image_name: str) -> str:
+        """Get file path of an image name or url, e.g. to serve it with FileResponse."""
+        if self._url_prefix:
+            image_name = image_name.removeprefix(self._url_prefix + '/')
+        return os.path.join(self._base_path, image_name)
 
     async def load_image_async(self, image_name: str) -> Optional[bytes]:
-        """Load image."""
+        """Load image, prefer get_image_path when the bytes are only sent on."""
         try:
-            if self._url_prefix:
-                image_name = image_name.removeprefix(self._url_prefix + '/')
-            async with aiofiles.open(os.path.join(self._base_path, image_name), 'rb') as f:
+            async with aiofiles.open(self.get_image_path(image_name), 'rb') as f:
                 return await f.read()
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOGGER.error('Load image error, %s: %s', image_name, err)
             return None
 
     async def load_image_list_async(self, image_name_list: List) -> List:
-        """Load image list."""
-        image_list = []
-        tasks = []
-        for image_name in image_name_list:
-            tasks.append(self.load_image_async(image_name))
-        image_list = await asyncio.gather(*tasks, return_exceptions=True)
-        return image_list
+        """Load image list, all files are read in one worker thread hop."""
+        if not image_name_list:
+            return []
+        return await asyncio.to_thread(
+            lambda: [self._load_image(image_name) for image_name in image_name_list])
+
+    def _load_image(self, image_name: str) -> Optional[bytes]:
+        """Load image file, blocking."""
+        try:
+            with open(self.get_image_path(image_name), 'rb') as f:
+                return f.read()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            _LOGGER.error('Load image error, %s: %s', image_name, err)
+            return None
 
-    async def delete_image_async(self, image_name: str) -> bool:
-        """Delete image."""
+    def _delete_image(self, image_name: str) -> bool:
+        """Delete image file, blocking."""
         try:
-            if self._url_prefix:
-                image_name = image_name.removeprefix(self._url_prefix + '/')
-            await asyncio.to_thread(os.remove, os.path.join(self._base_path,  image_name))
+            os.remove(self.get_image_path(image_name))
             _LOGGER.info('Delete image success, %s', image_name)
             return True
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOGGER.error('Delete image error, %s: %s', image_name, err)
             return False
 
+    async def delete_image_async(self, image_name: str) -> bool:
+        """Delete image."""
+        return await asyncio.to_thread(self._delete_image, image_name)
+
     async def delete_image_list_async(self, image_name_list: List) -> bool:
-        """Delete image list."""
+        """Delete image list, all files are removed in one worker thread hop."""
         image_name_set = set(image_name_list)
-        tasks = []
-        for image_name in image_name_set:
-            tasks.append(self.delete_image_async(image_name))
-        result_list = await asyncio.gather(*tasks, return_exceptions=True)
+        if not image_name_set:
+            return True
+        result_list = await asyncio.to_thread(
+            lambda: [self._delete_image(image_name) for image_name in image_name_set])
         return all(result_list)
 
-    async def __generate_name(self, did: str, channel: int = 0) -> str:
-        dt_now = datetime.now()
-        dt_prefix = dt_now.strftime('%y%m%d')
-        if dt_prefix != self._dt_prefix:
-            # New path
-            self.dt_prefix = dt_prefix
-            os.makedirs(os.path.join(self._base_path, self.dt_prefix), exist_ok=True)
-
-        id_hash = hashlib.md5(f'{did}{channel}'.encode()).hexdigest()
-        ts_now = int(dt_now.timestamp()*1000)
-        gen_id = await self.__next_id()
-
-        return os.path.join(self._dt_prefix, f'{id_hash}_{ts_now}_{gen_id:04d}.jpg')
-
-    async def __next_id(self) -> int:
-        async with self._counter_lock:
-            self._counter += 1
-            if self._counter > 9999:
-                self._counter = 0
-            return self._counter
-
-
-image_manager = ImageManager(base_path=str(IMAGE_DIR), url_prefix='/static/camera/images')
+    def __generate_name(self, did: str, channel: int = 0) -> str:
+        now = time.time()
+        if now >= self._dt_prefix_expire:
+            self.__roll_dt_prefix(now)
+
+        name_prefix = self._name_prefix_cache.get((did, channel))
+        if name_prefix is None:
+            id_hash = hashlib.md5(f'{did}{channel}'.encode()).hexdigest()
+            name_prefix = os.path.join(self._dt_prefix, f'{id_hash}_')
+            self._name_prefix_cache[(did, channel)] = name_prefix
+        gen_id = self.__next_id()
+
+        return f'{name_prefix}{int(now * 1000)}_{gen_id:04d}.jpg'
+
+    def __roll_dt_prefix(self, now: float) -> None:
+        """Switch to the date path of now, valid until the next local midnight."""
+        dt_now = datetime.fromtimestamp(now)
+        self._dt_prefix = dt_now.strftime('%y%m%d')
+        next_day = (dt_now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._dt_prefix_expire = next_day.timestamp()
+        self._name_prefix_cache.clear()
+        # New path
+        os.makedirs(os.path.join(self._base_path, self._dt_prefix), exist_ok=True)
+
+    def __next_id(self) -> int:
+        # Only called on the event loop, no lock needed
+        return next(self._counter) % 10000
+
+@functools.cache
+def get_image_manager() -> ImageManager:
+    """Get the shared image manager, created on first use."""
+    return ImageManager(base_path=str(IMAGE_DIR), url_prefix='/static/camera/images')
@@ -8,12 +8,14 @@ Provides functionality for logging configuration, certificate management, and JS
 
 import base64
 import datetime
+import io
 import ipaddress
+import json
 import logging
 import os
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -137,6 +139,10 @@ def _generate_localhost_cert(cert_path: str, key_path: str, years_valid: int, co
     logger.info("generate localhost cert success, %s, %s", cert_path, key_path)
 
 
+# (cert_path, mtime_ns, size) -> expiry of a certificate found valid, a rewritten file misses
+_cert_not_valid_after_cache: dict[tuple[str, int, int], datetime.datetime] = {}
+
+
 def update_localhost_cert(cert_path: str, key_path: str, years_valid: int = 10, country_name: str = "CN"):
     """Generate a self-signed certificate for localhost."""
 
@@ -149,6 +155,17 @@ def update_localhost_cert(cert_path: str, key_path: str, years_valid: int = 10,
             cert_path=cert_path, key_path=key_path, years_valid=years_valid, country_name=country_name)
         return
 
+    # Get the current time.
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    # Skip parsing when this exact file was already seen valid
+    stat = os.stat(cert_path)
+    cache_key = (cert_path, stat.st_mtime_ns, stat.st_size)
+    not_valid_after = _cert_not_valid_after_cache.get(cache_key)
+    if not_valid_after is not None and not_valid_after >= now:
+        logger.info("cert valid, not re-generate, expired at %s", not_valid_after)
+        return
+
     # Read the certificate.
     try:
         with open(cert_path, "rb") as f:
@@ -157,9 +174,6 @@ def update_localhost_cert(cert_path: str, key_path: str, years_valid: int = 10,
     except Exception as e:
         raise RuntimeError(f"cert read error: {e}") from e
 
-    # Get the current time.
-    now = datetime.datetime.now(datetime.timezone.utc)
-
     # Check if the certificate is expired.
     if cert.not_valid_after_utc < now:
         cn = None
@@ -175,6 +189,7 @@ def update_localhost_cert(cert_path: str, key_path: str, years_valid: int = 10,
         else:
             raise RuntimeError(f"certificate expired, CN={cn}, not localhost, not re-generate")
     else:
+        _cert_not_valid_after_cache[cache_key] = cert.not_valid_after_utc
         logger.info("cert valid, not re-generate, expired at %s", cert.not_valid_after_utc)
 
 
@@ -192,6 +207,9 @@ def bytes_to_base64(image_data: bytes) -> str:
     return f"data:image/jpeg;base64,{encoded_data}"
 
 
+_TAIL_BLOCK_SIZE = 8192
+
+
 def read_last_n_lines(file_path: str, n: int) -> List[str]:
     """
     Read the last n lines of a file
@@ -206,15 +224,34 @@ def read_last_n_lines(file_path: str, n: int) -> List[str]:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with open(file_path, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-        # Get the last n lines, if file has fewer than n lines, return all lines
-        return lines[-n:] if len(lines) >= n else lines
+    if n <= 0:
+        with open(file_path, "r", encoding="utf-8") as file:
+            lines = file.readlines()
+            return lines[-n:] if len(lines) >= n else lines
+
+    # Read blocks backwards from the end until more than n line breaks are seen,
+    # the part before the first break may be a partial line and is dropped
+    with open(file_path, "rb") as file:
+        offset = file.seek(0, os.SEEK_END)
+        data = b""
+        while offset > 0 and data.count(b"\n") <= n:
+            read_size = min(_TAIL_BLOCK_SIZE, offset)
+            offset -= read_size
+            file.seek(offset)
+            data = file.read(read_size) + data
+        if offset > 0:
+            data = data[data.index(b"\n") + 1:]
+
+    # Same newline handling as reading the file in text mode
+    lines = io.StringIO(data.decode("utf-8"), newline=None).readlines()
+    # Get the last n lines, if file has fewer than n lines, return all lines
+    return lines[-n:]
 
 
 # Pre-compile regex patterns to avoid recompilation on each call
 _JSON_MARKDOWN_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
 _JSON_BRACES_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
 
 
 def extract_json_from_content(content: str) -> str:
@@ -225,10 +262,15 @@ def extract_json_from_content(content: str) -> str:
     # Remove leading and trailing whitespace
     content = content.strip()
 
-    # Try to extract JSON from markdown code blocks (using pre-compiled regex)
-    json_match = _JSON_MARKDOWN_PATTERN.search(content)
-    if json_match:
-        return json_match.group(1).strip()
+    # Try to extract JSON from markdown code blocks (using pre-compiled regex),
+    # the substring tests skip a regex scan that can not match
+    if "```" in content:
+        json_match = _JSON_MARKDOWN_PATTERN.search(content)
+        if json_match:
+            return json_match.group(1).strip()
+
+    if "{" not in content:
+        return content
 
     # Try to extract JSON surrounded by braces (using pre-compiled regex)
     json_match = _JSON_BRACES_PATTERN.search(content)
@@ -237,3 +279,31 @@ def extract_json_from_content(content: str) -> str:
 
     # If no JSON format found, return original content
     return content
+
+
+def load_json_from_content(content: str) -> Any:
+    """
+    Parse JSON object from LLM returned content
+    A markdown code block is preferred, otherwise the first object that decodes
+    is returned and any text around it is ignored
+
+    Raises:
+        json.JSONDecodeError: When no JSON object can be decoded
+    """
+    content = content.strip()
+
+    if "```" in content:
+        json_match = _JSON_MARKDOWN_PATTERN.search(content)
+        if json_match:
+            return json.loads(json_match.group(1))
+
+    # Decode in place from each "{" instead of slicing out a candidate first,
+    # the decoder stops at the end of the object in a single pass
+    start = content.find("{")
+    while start != -1:
+        try:
+            return _JSON_DECODER.raw_decode(content, start)[0]
+        except json.JSONDecodeError:
+            start = content.find("{", start + 1)
+
+    return json.loads(content)
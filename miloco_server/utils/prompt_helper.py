@@ -7,6 +7,7 @@ Provides builders for trigger rule conditions and vision understanding prompts.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 import logging
 from miloco_server.config.prompt_config import PromptConfig, PromptType, UserLanguage, CAMERA_IMG_FRAME_INTERVAL
@@ -24,6 +25,26 @@ class TriggerRuleConditionPromptBuilder:
         """Convert millisecond timestamp to YYYY-MM-DD HH:MM:SS format"""
         return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_static_texts(condition: str, language: UserLanguage) -> dict[str, str]:
+        """Texts only depending on rule condition and language, rendered once per rule change"""
+        prefixes = PromptConfig.get_trigger_rule_condition_prefixes(language)
+        return {
+            "system_prompt": PromptConfig.get_prompt(PromptType.TRIGGER_RULE_CONDITION, language),
+            "current_time_prefix": prefixes["current_time_prefix"],
+            "current_frames_text": prefixes["current_frames_prefix"].format(
+                vision_use_img_count=TRIGGER_RULE_RUNNER_CONFIG["vision_use_img_count"],
+                frame_interval=CAMERA_IMG_FRAME_INTERVAL
+            ),
+            "last_happened_time_prefix": prefixes["last_happened_time_prefix"],
+            "last_happened_frames_text": prefixes["last_happened_frames_prefix"].format(
+                vision_use_img_count=TRIGGER_RULE_RUNNER_CONFIG["vision_use_img_count"],
+                frame_interval=CAMERA_IMG_FRAME_INTERVAL
+            ),
+            "condition_question_text": prefixes["condition_question_template"].format(condition=condition),
+        }
+
     @staticmethod
     def build_trigger_rule_prompt(
         img_seq: CameraImgSeq,
@@ -33,14 +54,10 @@ class TriggerRuleConditionPromptBuilder:
     ) -> ChatHistoryMessages:
         chat_history_messages = ChatHistoryMessages()
 
-        img_seq_base64 = img_seq.to_base64()
+        static_texts = TriggerRuleConditionPromptBuilder._build_static_texts(condition, language)
 
         # Get system prompt from config
-        system_prompt = PromptConfig.get_prompt(PromptType.TRIGGER_RULE_CONDITION, language)
-        chat_history_messages.add_content("system", system_prompt)
-
-        # Get user content prefixes from config
-        prefixes = PromptConfig.get_trigger_rule_condition_prefixes(language)
+        chat_history_messages.add_content("system", static_texts["system_prompt"])
 
         user_content = []
 
@@ -49,63 +66,54 @@ class TriggerRuleConditionPromptBuilder:
             img_seq.img_list[0].timestamp)
         user_content.append({
             "type": "text",
-            "text": prefixes["current_time_prefix"].format(time=current_time_str)
+            "text": static_texts["current_time_prefix"].format(time=current_time_str)
         })
 
         # current_frames
         user_content.append({
             "type": "text",
-            "text": prefixes["current_frames_prefix"].format(
-                vision_use_img_count=TRIGGER_RULE_RUNNER_CONFIG["vision_use_img_count"],
-                frame_interval=CAMERA_IMG_FRAME_INTERVAL
-            )
+            "text": static_texts["current_frames_text"]
         })
-        for image_data in img_seq_base64.img_list:
+        for image_data in img_seq.img_list:
             user_content.append({
                 "type": "image_url",
                 "image_url": {
-                    "url": image_data.data
+                    "url": image_data.base64_data
                 }
             })
 
         # last_happened_frames and last_happened_time
         if last_happened_img_seq is not None and last_happened_img_seq.img_list:
             logger.info("Last Image Detected")
-            last_happened_base64 = last_happened_img_seq.to_base64()
             last_time_str = TriggerRuleConditionPromptBuilder._s_to_time_str(
                 last_happened_img_seq.img_list[0].timestamp)
             user_content.append({
                 "type": "text",
-                "text": prefixes["last_happened_time_prefix"].format(time=last_time_str)
+                "text": static_texts["last_happened_time_prefix"].format(time=last_time_str)
             })
             user_content.append({
                 "type": "text",
-                "text": prefixes["last_happened_frames_prefix"].format(
-                    vision_use_img_count=TRIGGER_RULE_RUNNER_CONFIG["vision_use_img_count"],
-                    frame_interval=CAMERA_IMG_FRAME_INTERVAL
-                )
+                "text": static_texts["last_happened_frames_text"]
             })
-            for image_data in last_happened_base64.img_list:
+            for image_data in last_happened_img_seq.img_list:
                 user_content.append({
                     "type": "image_url",
                     "image_url": {
-                        "url": image_data.data
+                        "url": image_data.base64_data
                     }
                 })
 
         # user_rule_content
         user_content.append({
             "type": "text",
-            "text": prefixes["condition_question_template"].format(condition=condition)
+            "text": static_texts["condition_question_text"]
         })
 
         chat_history_messages.add_content("user", user_content)
 
-        temp_log_output = []
-        for item in user_content:
-            if item["type"] == "text":
-                temp_log_output.append(item["text"])
-        logger.debug(f"TriggerRuleConditionPromptBuilder: {temp_log_output}")
+        if logger.isEnabledFor(logging.DEBUG):
+            temp_log_output = [item["text"] for item in user_content if item["type"] == "text"]
+            logger.debug("TriggerRuleConditionPromptBuilder: %s", temp_log_output)
 
         return chat_history_messages
 
@@ -117,21 +125,32 @@ class VisionUnderstandToolPromptBuilder:
     def _get_system_prompt(language: UserLanguage = UserLanguage.CHINESE) -> str:
         return PromptConfig.get_prompt(PromptType.VISION_UNDERSTANDING, language)
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _build_static_texts(language: UserLanguage) -> dict[str, str]:
+        """Texts only depending on language, the fixed prompt prefix"""
+        prefixes = PromptConfig.get_vision_understanding_prefixes(language)
+        return {
+            "system_prompt": VisionUnderstandToolPromptBuilder._get_system_prompt(language),
+            "user_content": prefixes["user_content"],
+            "camera_prefix": "\n" + prefixes["camera_prefix"],
+            "channel_prefix": prefixes["channel_prefix"],
+            "sequence_prefix": prefixes["sequence_prefix"],
+        }
+
     @staticmethod
     def build_prompt(
         camera_img_seqs: list[CameraImgSeq],
         query: str,
         language: UserLanguage = UserLanguage.CHINESE) -> ChatHistoryMessages:
 
+        static_texts = VisionUnderstandToolPromptBuilder._build_static_texts(language)
         chat_history_messages = ChatHistoryMessages()
-        chat_history_messages.add_content("system", VisionUnderstandToolPromptBuilder._get_system_prompt(language))
-
-        # Get language-specific prefixes from config
-        prefixes = PromptConfig.get_vision_understanding_prefixes(language)
-        chat_history_messages.add_content("user", prefixes["user_content"])
-        camera_prefix = prefixes["camera_prefix"]
-        channel_prefix = prefixes["channel_prefix"]
-        sequence_prefix = prefixes["sequence_prefix"]
+        chat_history_messages.add_content("system", static_texts["system_prompt"])
+        chat_history_messages.add_content("user", static_texts["user_content"])
+        camera_prefix = static_texts["camera_prefix"]
+        channel_prefix = static_texts["channel_prefix"]
+        sequence_prefix = static_texts["sequence_prefix"]
 
         user_content = []
 
@@ -139,7 +158,7 @@ class VisionUnderstandToolPromptBuilder:
             img_seq_base64 = image_seq.to_base64()
             user_content.append({
                 "type": "text",
-                "text": (f"\n{camera_prefix}{img_seq_base64.camera_info.name}"
+                "text": (f"{camera_prefix}{img_seq_base64.camera_info.name}"
                         f"{channel_prefix}{img_seq_base64.channel}{sequence_prefix}")
             })
 